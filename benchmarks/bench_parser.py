@@ -0,0 +1,66 @@
+"""Microbenchmark: response parser versus the former str.split parsing.
+
+Run from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_parser.py
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components"))
+
+from dolby_cp750.parser import POLL_COMMANDS, parse_response  # noqa: E402
+
+RESPONSES = {
+    "fader": "cp750.sys.fader 70",
+    "input": "cp750.sys.input_mode dig_1",
+    "mute": "cp750.sys.mute 0",
+    **{f"dig_{i}_valid": f"cp750.state.dig_{i}_valid 1" for i in range(1, 5)},
+}
+# The keys the former parsing handled, a subset of those polled now
+assert RESPONSES.keys() <= POLL_COMMANDS.keys()
+
+
+def legacy_poll() -> dict:
+    """Parse one poll the way the coordinator used to."""
+    fader = RESPONSES["fader"]
+    input_mode = RESPONSES["input"]
+    mute = RESPONSES["mute"]
+    data = {
+        "fader": float(fader.split()[1]) if len(fader.split()) >= 2 else None,
+        "input": input_mode.split()[1] if len(input_mode.split()) >= 2 else None,
+        "mute": mute.split()[1] == "1" if len(mute.split()) >= 2 else None,
+    }
+    for i in range(1, 5):
+        response = RESPONSES[f"dig_{i}_valid"]
+        data[f"dig_{i}_valid"] = response.split()[1] == "1" if len(response.split()) >= 2 else None
+    return data
+
+
+def parser_poll() -> dict:
+    """Parse one poll with the compiled response table."""
+    return {
+        data_key: parse_response(data_key, response)
+        for data_key, response in RESPONSES.items()
+    }
+
+
+def main() -> None:
+    """Time both implementations and print the speedup."""
+    assert legacy_poll() == parser_poll()
+
+    number = 200_000
+    results = {}
+    for name, func in (("str.split", legacy_poll), ("parser", parser_poll)):
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = best
+        print(f"{name:>10}: {best / number * 1e6:.2f} us per poll")
+
+    print(f"   speedup: {results['str.split'] / results['parser']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
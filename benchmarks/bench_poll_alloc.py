@@ -0,0 +1,188 @@
+"""Measure memory allocated by each coordinator poll with tracemalloc.
+
+Every key is made due on each tick, so this is the worst-case poll. The
+poll path from before user-014 is measured too, as the baseline. Run
+from the repository root with Home Assistant installed:
+
+    python benchmarks/bench_poll_alloc.py --ticks 500
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+import gc
+from pathlib import Path
+import sys
+import tempfile
+import tracemalloc
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components"))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from dolby_cp750.const import DolbyCP750Protocol  # noqa: E402
+from dolby_cp750.coordinator import DolbyCP750Coordinator  # noqa: E402
+from dolby_cp750.parser import POLL_COMMANDS, parse_response  # noqa: E402
+from simulator import INITIAL_STATE  # noqa: E402
+
+
+# Share of the former poll path's per-tick allocations that a poll may use,
+# which tests/test_poll_alloc.py checks. Measured against the baseline in
+# the same run, so it holds whatever Home Assistant adds around a refresh.
+MAX_ALLOCATION_RATIO = 0.8
+
+
+@dataclass
+class PollAllocations:
+    """Memory allocated by a run of polls."""
+
+    ticks: int
+    # Highest traced memory above the start of the tick, summed over ticks
+    allocated: int
+    retained: int
+    top: list[tracemalloc.StatisticDiff]
+
+    @property
+    def allocated_per_tick(self) -> float:
+        """Return the mean peak allocation of a poll, in bytes."""
+        return self.allocated / self.ticks
+
+    @property
+    def retained_per_tick(self) -> float:
+        """Return the bytes retained per poll."""
+        return self.retained / self.ticks
+
+
+class _LegacyCoordinator(DolbyCP750Coordinator):
+    """Coordinator polling the way it did before user-014.
+
+    Commands are encoded on every tick, the power switch is checked for
+    every batch and each tick builds a new data dict and changed key set.
+    """
+
+    async def _async_poll(self) -> dict[str, Any]:
+        """Fetch every key into a new dict."""
+        due = list(POLL_COMMANDS)
+        responses = await self.protocol.send_batch(
+            [POLL_COMMANDS[data_key] for data_key in due]
+        )
+        data = dict(self.data)
+        self.changed_keys = set()
+        for data_key, response in zip(due, responses):
+            if response is None:
+                continue
+            try:
+                value = parse_response(data_key, response)
+            except ValueError:
+                value = None
+            if data.get(data_key) != value:
+                self.changed_keys.add(data_key)
+            data[data_key] = value
+        return data
+
+    def _async_data_to_store(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {"values": self.data}
+
+
+async def _trace(tick: Callable[[], Awaitable[None]], ticks: int, top: int) -> PollAllocations:
+    """Run ticks under tracemalloc and return what they allocated."""
+    # Warm up connection, caches and interned strings
+    for _ in range(20):
+        await tick()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    allocated = 0
+    for _ in range(ticks):
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await tick()
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += peak - current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    return PollAllocations(
+        ticks=ticks,
+        allocated=allocated,
+        retained=sum(stat.size_diff for stat in stats if stat.size_diff > 0),
+        top=after.compare_to(before, "lineno")[:top],
+    )
+
+
+class _ReplayProtocol(DolbyCP750Protocol):
+    """Protocol answering from the simulator's state without a socket.
+
+    Everything above the request queue runs as usual, while the socket
+    buffers, whose size has nothing to do with the poll path, stay out of
+    the measurement.
+    """
+
+    async def _async_submit(
+        self,
+        requests: Sequence[tuple[str, bytes]],
+        probes: Sequence[tuple[str, bytes]] = (),
+    ) -> list[str | None]:
+        """Answer every key the simulator knows."""
+        return [
+            f"{key} {INITIAL_STATE[key]}" if key in INITIAL_STATE else None
+            for key, _ in (*requests, *probes)
+        ]
+
+
+async def measure_poll_allocations(
+    ticks: int, top: int = 0, legacy: bool = False
+) -> PollAllocations:
+    """Poll a simulated processor and trace what the polls allocate.
+
+    legacy=True polls the way the coordinator did before user-014, as the
+    baseline the current poll path is compared with.
+    """
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        protocol = _ReplayProtocol(hass, "127.0.0.1", 0)
+        coordinator_class = _LegacyCoordinator if legacy else DolbyCP750Coordinator
+        coordinator = coordinator_class(hass, protocol, "Benchmark", "benchmark")
+        if legacy:
+            coordinator.data = {}
+
+        async def tick() -> None:
+            coordinator._async_reset_schedule()  # pylint: disable=protected-access
+            await coordinator.async_refresh()
+
+        result = await _trace(tick, ticks, top)
+
+        await coordinator.async_shutdown()
+    return result
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Report allocations per tick for the current and the former poll path."""
+    results = {}
+    for name, legacy in (("current", False), ("legacy", True)):
+        result = results[name] = await measure_poll_allocations(args.ticks, args.top, legacy)
+        print(f"{name} poll, {result.ticks} ticks")
+        print(f"  allocated per tick:  {result.allocated_per_tick:.0f} bytes at peak")
+        print(f"  retained per tick:   {result.retained_per_tick:.0f} bytes")
+        for stat in result.top:
+            print(f"    {stat}")
+    ratio = results["current"].allocated_per_tick / results["legacy"].allocated_per_tick
+    print(f"current / legacy:      {ratio:.2f} (bound {MAX_ALLOCATION_RATIO})")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--top", type=int, default=0, help="show the top allocation sites")
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Protocol benchmark against simulated CP750 processors.
+
+Reports poll latency percentiles, write throughput and reconnect time for
+fleets of 1, 10 and 50 simulated devices. Run from the repository root with
+Home Assistant installed:
+
+    python benchmarks/bench_protocol.py --latency 0.002 --polls 200
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "custom_components"))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from dolby_cp750.const import DolbyCP750Protocol  # noqa: E402
+from dolby_cp750.parser import POLL_COMMANDS  # noqa: E402
+from simulator import CP750Simulator  # noqa: E402
+
+QUERIES = list(POLL_COMMANDS.values())
+
+
+def _percentiles(samples: list[float]) -> str:
+    """Format p50/p95/p99 of samples in milliseconds."""
+    if len(samples) < 2:
+        return "n/a"
+    cuts = statistics.quantiles(samples, n=100)
+    return (
+        f"p50 {cuts[49] * 1000:.2f} ms  "
+        f"p95 {cuts[94] * 1000:.2f} ms  "
+        f"p99 {cuts[98] * 1000:.2f} ms"
+    )
+
+
+async def _poll_latency(protocol: DolbyCP750Protocol, polls: int) -> tuple[list[float], int]:
+    """Run sequential polls, returning their durations and failure count."""
+    samples = []
+    failures = 0
+    for _ in range(polls):
+        start = time.perf_counter()
+        try:
+            await protocol.send_batch(QUERIES)
+        except ConnectionError:
+            failures += 1
+            continue
+        samples.append(time.perf_counter() - start)
+    return samples, failures
+
+
+async def _reconnect_time(protocol: DolbyCP750Protocol, limit: float) -> float | None:
+    """Return how long it takes a dropped session to serve a poll again."""
+    start = time.perf_counter()
+    while time.perf_counter() - start < limit:
+        try:
+            await protocol.send_batch(QUERIES)
+            return time.perf_counter() - start
+        except ConnectionError:
+            await asyncio.sleep(0.05)
+    return None
+
+
+async def bench_fleet(hass: HomeAssistant, devices: int, args: argparse.Namespace) -> None:
+    """Benchmark one fleet size."""
+    simulators = [
+        CP750Simulator(latency=args.latency, jitter=args.jitter, loss=args.loss)
+        for _ in range(devices)
+    ]
+    for simulator in simulators:
+        await simulator.start()
+    protocols = [
+        DolbyCP750Protocol(hass, simulator.host, simulator.port)
+        for simulator in simulators
+    ]
+
+    try:
+        results = await asyncio.gather(*(_poll_latency(p, args.polls) for p in protocols))
+        samples = [sample for device_samples, _ in results for sample in device_samples]
+        failures = sum(device_failures for _, device_failures in results)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                protocol.send_command(f"cp750.sys.fader {level % 100}")
+                for protocol in protocols
+                for level in range(args.writes)
+            ),
+            return_exceptions=True,
+        )
+        throughput = devices * args.writes / (time.perf_counter() - start)
+
+        for simulator in simulators:
+            simulator.drop_connections()
+        await asyncio.sleep(0.05)
+        reconnects = await asyncio.gather(*(_reconnect_time(p, 30.0) for p in protocols))
+        recovered = [value for value in reconnects if value is not None]
+
+        print(f"{devices} device(s)")
+        print(f"  poll latency   {_percentiles(samples)}  ({failures} failed)")
+        print(f"  throughput     {throughput:.0f} commands/s")
+        if recovered:
+            print(
+                f"  reconnect      max {max(recovered) * 1000:.1f} ms"
+                f"  ({len(recovered)}/{devices} recovered)"
+            )
+        else:
+            print("  reconnect      none recovered")
+    finally:
+        for protocol in protocols:
+            await protocol.disconnect()
+        for simulator in simulators:
+            await simulator.stop()
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run every fleet size."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for devices in args.devices:
+            await bench_fleet(hass, devices, args)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--polls", type=int, default=100)
+    parser.add_argument("--writes", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
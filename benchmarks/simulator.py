@@ -0,0 +1,158 @@
+"""Offline Dolby CP750 simulator.
+
+Speaks the cp750.sys.* / cp750.state.* line protocol on localhost so the
+integration can be exercised without a processor. Replies can be delayed
+and dropped, sessions can be cut, and the front panel fader can be turned
+to send unsolicited notifications.
+
+Run standalone to point a Home Assistant instance at it:
+
+    python benchmarks/simulator.py --port 61408 --latency 0.005
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_STATE = {
+    "cp750.sys.fader": "70",
+    "cp750.sys.input_mode": "dig_1",
+    "cp750.sys.mute": "0",
+    **{f"cp750.state.dig_{i}_valid": "1" for i in range(1, 5)},
+    "cp750.state.format": "5.1",
+    "cp750.state.decoder_mode": "pcm",
+    "cp750.sys.delay": "0",
+    **{
+        f"cp750.sys.{source}_fader_preset": "70"
+        for source in ("analog", "dig_1", "dig_2", "dig_3", "dig_4", "mic", "non_sync")
+    },
+}
+
+
+class CP750Simulator:
+    """Simulated CP750 processor."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+    ) -> None:
+        """Initialize the simulator.
+
+        latency/jitter are in seconds per reply, loss is the probability of a
+        reply being dropped. Port 0 picks a free port.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.state = dict(INITIAL_STATE)
+        self.commands = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._sessions: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening and close every session."""
+        if self._server:
+            self._server.close()
+            self.drop_connections()
+            await asyncio.gather(*self._sessions, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def drop_connections(self) -> None:
+        """Cut every open session, as a flaky booth switch would."""
+        for writer in list(self._writers):
+            writer.close()
+        self._writers.clear()
+
+    def notify(self, key: str, value: str) -> None:
+        """Change a value on the device and push it to every session."""
+        self.state[key] = value
+        message = f"{key} {value}\r\n".encode()
+        for writer in self._writers:
+            writer.write(message)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client session."""
+        session = asyncio.current_task()
+        self._sessions.add(session)
+        self._writers.add(writer)
+        try:
+            while line := await reader.readline():
+                key, _, value = line.decode().strip().partition(" ")
+                if not key:
+                    continue
+                self.commands += 1
+                if value != "?":
+                    self.state[key] = value
+                if random.random() < self.loss:
+                    continue
+                asyncio.get_running_loop().call_later(
+                    max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)),
+                    self._reply,
+                    writer,
+                    key,
+                )
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._sessions.discard(session)
+            writer.close()
+
+    def _reply(self, writer: asyncio.StreamWriter, key: str) -> None:
+        """Send the current value of key."""
+        if writer.is_closing():
+            return
+        writer.write(f"{key} {self.state.get(key, '0')}\r\n".encode())
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Run a simulator until interrupted, turning the fader now and then."""
+    simulator = CP750Simulator(
+        args.host, args.port, args.latency, args.jitter, args.loss
+    )
+    await simulator.start()
+    _LOGGER.info("CP750 simulator listening on %s:%d", simulator.host, simulator.port)
+    while True:
+        await asyncio.sleep(args.notify_every or 3600)
+        if args.notify_every:
+            simulator.notify("cp750.sys.fader", str(random.randint(40, 80)))
+
+
+def main() -> None:
+    """Parse arguments and run the simulator."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=61408)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument(
+        "--notify-every", type=float, default=0.0,
+        help="seconds between simulated front panel fader changes",
+    )
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_run(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
 
 import voluptuous as vol
 
@@ -15,35 +14,40 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 
-from .const import DOMAIN, DolbyCP750Protocol  # Aggiungiamo l'importazione qui
-from .coordinator import DolbyCP750Coordinator # Aggiungiamo anche questa
+from .const import DATA_MANAGER, DEFAULT_NAME, DEFAULT_PORT, DOMAIN, STORAGE_VERSION
+from .manager import DolbyCP750Manager
+from .profiles import profile_from_options
+from .schedule import schedule_from_options
+from .services import async_setup_services, async_unload_services
+from .statistics import DolbyCP750Statistics
 
 _LOGGER = logging.getLogger(__name__)
 
-DOMAIN: Final = "dolby_cp750"
-DEFAULT_NAME: Final = "Dolby CP750" 
-DEFAULT_PORT: Final = 61408
-
-PLATFORMS: list[Platform] = ["select", "number", "switch", "binary_sensor"]
+PLATFORMS: list[Platform] = ["select", "number", "switch", "binary_sensor", "sensor"]
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Dolby CP750 from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create protocol and coordinator
-    protocol = DolbyCP750Protocol(
-        hass,
+    # One manager owns the connections of every processor
+    if DATA_MANAGER not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_MANAGER] = DolbyCP750Manager(hass)
+        await async_setup_services(hass)
+    manager: DolbyCP750Manager = hass.data[DOMAIN][DATA_MANAGER]
+
+    coordinator = manager.async_add_device(
+        entry.entry_id,
         entry.data[CONF_HOST],
         entry.data.get(CONF_PORT, DEFAULT_PORT),
-        entry.data.get("power_switch")
-    )
-    
-    coordinator = DolbyCP750Coordinator(
-        hass,
-        protocol,
-        entry.data.get(CONF_NAME, DEFAULT_NAME)
+        entry.data.get(CONF_NAME, DEFAULT_NAME),
+        entry.data.get("power_switch"),
+        profile_from_options(entry.options),
+        schedule_from_options(hass, entry.options),
     )
+    # Render the last known state right away, fresh data follows
+    await coordinator.async_restore()
     
     # Store configuration data
     hass.data[DOMAIN][entry.entry_id] = {
@@ -56,14 +60,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Load platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Hourly rollups for long-term history, if history is recorded at all
+    if "recorder" in hass.config.components:
+        statistics = DolbyCP750Statistics(
+            hass, coordinator, entry.entry_id, entry.data.get(CONF_NAME, DEFAULT_NAME)
+        )
+        statistics.async_start()
+        entry.async_on_unload(statistics.async_stop)
+
+    # Profile changes apply live, without reloading the entry
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     
     return True
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the performance profile and show schedule set in the options."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinator.async_set_profile(profile_from_options(entry.options))
+    coordinator.async_set_show_schedule(schedule_from_options(hass, entry.options))
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        manager: DolbyCP750Manager = hass.data[DOMAIN][DATA_MANAGER]
+        await manager.async_remove_device(entry.entry_id)
+        if manager.is_empty:
+            hass.data[DOMAIN].pop(DATA_MANAGER)
+            async_unload_services(hass)
+
+    return unload_ok
 
-    return unload_ok
\ No newline at end of file
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the saved state of a removed processor."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
@@ -12,45 +12,93 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_SWITCHES,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, DolbyCP750Protocol
+from .const import DEFAULT_NAME, DEFAULT_PORT, DOMAIN
+from .discovery import async_discover, async_probe
+from .profiles import (
+    CONF_FAST_MAX_INTERVAL,
+    CONF_FAST_MIN_INTERVAL,
+    CONF_PROFILE,
+    CONF_RESPONSE_TIMEOUT,
+    CONF_SLOW_MAX_INTERVAL,
+    CONF_SLOW_MIN_INTERVAL,
+    PROFILES,
+    Profile,
+)
+from .registry import PollClass
+from .schedule import (
+    CONF_PREWARM,
+    CONF_SHOW_CALENDAR,
+    CONF_SHOW_WINDOWS,
+    DEFAULT_PREWARM,
+    parse_show_windows,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-DEFAULT_PORT = 61408
-DEFAULT_NAME = "Dolby CP750"
+CONF_SUBNET = "subnet"
+CONF_HOSTS = "hosts"
 
 class DolbyCP750ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Dolby CP750."""
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> DolbyCP750OptionsFlow:
+        """Return the options flow."""
+        return DolbyCP750OptionsFlow(config_entry)
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._data = {}
+        self._discovered: list[str] = []
 
     async def _test_connection(self, host: str, port: int) -> bool:
-        """Test if we can connect to the CP750."""
-        try:
-            protocol = DolbyCP750Protocol(self.hass, host, port)
-            await protocol.connect()
-            await protocol.disconnect()
+        """Test if the host answers as a CP750."""
+        if await async_probe(host, port):
             return True
-        except Exception as err:
-            _LOGGER.error("Connection test failed: %s", err)
-            return False
+
+        _LOGGER.error("Connection test to %s:%s failed", host, port)
+        return False
+
+    async def _async_set_host(self, host: str) -> None:
+        """Identify the flow by its host, aborting if it is already set up."""
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
+        # Entries created before hosts became unique ids have none
+        self._async_abort_entries_match({CONF_HOST: host})
+
+    def _configured_hosts(self) -> set[str]:
+        """Return the hosts that already have a config entry."""
+        return {
+            entry.data[CONF_HOST] for entry in self._async_current_entries()
+        }
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the initial step."""
+        """Let the user add one processor or scan the network."""
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=["manual", "discover"],
+        )
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle a processor entered by hand."""
         errors = {}
 
         if user_input is not None:
+            await self._async_set_host(user_input[CONF_HOST])
             # Test the connection
             if await self._test_connection(user_input[CONF_HOST], user_input[CONF_PORT]):
                 self._data.update(user_input)
@@ -61,7 +109,7 @@ class DolbyCP750ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Show the form
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required(CONF_HOST): str,
@@ -72,6 +120,115 @@ class DolbyCP750ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a subnet for processors."""
+        errors = {}
+
+        if user_input is not None:
+            self._data[CONF_PORT] = user_input[CONF_PORT]
+            try:
+                found = await async_discover(
+                    user_input[CONF_SUBNET], user_input[CONF_PORT]
+                )
+            except ValueError:
+                errors["base"] = "invalid_subnet"
+            else:
+                configured = self._configured_hosts()
+                self._discovered = [host for host in found if host not in configured]
+                if self._discovered:
+                    return await self.async_step_select_devices()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_SUBNET): str,
+                    vol.Required(CONF_PORT, default=DEFAULT_PORT): int,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_select_devices(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Onboard the discovered processors the user picked."""
+        errors = {}
+
+        if user_input is not None:
+            hosts = user_input[CONF_HOSTS]
+            if hosts:
+                port = self._data[CONF_PORT]
+                # Every processor but the first is offered as discovered,
+                # to be confirmed on its own
+                for host in hosts[1:]:
+                    self.hass.async_create_task(
+                        self.hass.config_entries.flow.async_init(
+                            DOMAIN,
+                            context={
+                                "source": config_entries.SOURCE_INTEGRATION_DISCOVERY
+                            },
+                            data={CONF_HOST: host, CONF_PORT: port},
+                        )
+                    )
+                await self._async_set_host(hosts[0])
+                data = self._discovered_data(hosts[0], port)
+                return self.async_create_entry(title=data[CONF_NAME], data=data)
+            errors["base"] = "no_devices_selected"
+
+        return self.async_show_form(
+            step_id="select_devices",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_HOSTS, default=self._discovered
+                    ): cv.multi_select({host: host for host in self._discovered}),
+                }
+            ),
+            description_placeholders={
+                "devices_found": str(len(self._discovered)),
+            },
+            errors=errors,
+        )
+
+    @staticmethod
+    def _discovered_data(host: str, port: int) -> dict[str, Any]:
+        """Return the entry data of a discovered processor."""
+        return {
+            CONF_HOST: host,
+            CONF_PORT: port,
+            CONF_NAME: f"{DEFAULT_NAME} {host}",
+        }
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Handle a processor found by a network scan."""
+        host = discovery_info[CONF_HOST]
+        await self._async_set_host(host)
+
+        self._data = self._discovered_data(
+            host, discovery_info.get(CONF_PORT, DEFAULT_PORT)
+        )
+        self.context["title_placeholders"] = {"name": self._data[CONF_NAME]}
+        return await self.async_step_discovery_confirm()
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm adding a discovered processor."""
+        if user_input is not None:
+            return self.async_create_entry(title=self._data[CONF_NAME], data=self._data)
+
+        self._set_confirm_only()
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            description_placeholders={"host": self._data[CONF_HOST]},
+        )
+
     async def async_step_power_switch(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -104,4 +261,118 @@ class DolbyCP750ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders={
                 "switches_available": str(len(switch_entities)),
             },
-        )
\ No newline at end of file
+        )
+
+
+class DolbyCP750OptionsFlow(config_entries.OptionsFlow):
+    """Handle the performance profile of a Dolby CP750."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._options: dict[str, Any] = dict(config_entry.options)
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select a performance profile and a show schedule."""
+        errors = {}
+
+        if user_input is not None:
+            try:
+                parse_show_windows(user_input.get(CONF_SHOW_WINDOWS, ""))
+            except ValueError:
+                errors[CONF_SHOW_WINDOWS] = "invalid_windows"
+            else:
+                # Cleared fields are left out of the input
+                for option in (CONF_SHOW_CALENDAR, CONF_SHOW_WINDOWS):
+                    self._options.pop(option, None)
+                self._options.update(user_input)
+                if user_input[CONF_PROFILE] == Profile.CUSTOM:
+                    return await self.async_step_custom()
+                return self.async_create_entry(title="", data=self._options)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_PROFILE,
+                        default=self._options.get(CONF_PROFILE, Profile.STANDARD),
+                    ): vol.In([profile.value for profile in Profile]),
+                    vol.Optional(
+                        CONF_SHOW_CALENDAR,
+                        description={
+                            "suggested_value": self._options.get(CONF_SHOW_CALENDAR)
+                        },
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="calendar"),
+                    ),
+                    vol.Optional(
+                        CONF_SHOW_WINDOWS,
+                        description={
+                            "suggested_value": self._options.get(CONF_SHOW_WINDOWS)
+                        },
+                    ): str,
+                    vol.Required(
+                        CONF_PREWARM,
+                        default=self._options.get(CONF_PREWARM, DEFAULT_PREWARM),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_custom(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Set the poll intervals and reply timeout by hand."""
+        errors = {}
+
+        if user_input is not None:
+            if (
+                user_input[CONF_FAST_MIN_INTERVAL] > user_input[CONF_FAST_MAX_INTERVAL]
+                or user_input[CONF_SLOW_MIN_INTERVAL] > user_input[CONF_SLOW_MAX_INTERVAL]
+            ):
+                errors["base"] = "invalid_intervals"
+            else:
+                self._options.update(user_input)
+                return self.async_create_entry(title="", data=self._options)
+
+        standard = PROFILES[Profile.STANDARD]
+
+        def default(option: str, poll_class: PollClass, index: int) -> float:
+            if option in self._options:
+                return self._options[option]
+            return standard.intervals[poll_class][index].total_seconds()
+
+        interval = vol.All(vol.Coerce(float), vol.Range(min=1, max=86400))
+        return self.async_show_form(
+            step_id="custom",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FAST_MIN_INTERVAL,
+                        default=default(CONF_FAST_MIN_INTERVAL, PollClass.FAST, 0),
+                    ): interval,
+                    vol.Required(
+                        CONF_FAST_MAX_INTERVAL,
+                        default=default(CONF_FAST_MAX_INTERVAL, PollClass.FAST, 1),
+                    ): interval,
+                    vol.Required(
+                        CONF_SLOW_MIN_INTERVAL,
+                        default=default(CONF_SLOW_MIN_INTERVAL, PollClass.SLOW, 0),
+                    ): interval,
+                    vol.Required(
+                        CONF_SLOW_MAX_INTERVAL,
+                        default=default(CONF_SLOW_MAX_INTERVAL, PollClass.SLOW, 1),
+                    ): interval,
+                    vol.Required(
+                        CONF_RESPONSE_TIMEOUT,
+                        default=self._options.get(
+                            CONF_RESPONSE_TIMEOUT, standard.response_timeout
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.2, max=30)),
+                }
+            ),
+            errors=errors,
+        )
@@ -1,16 +1,33 @@
 """Constants and protocol handler for the Dolby CP750."""
 import asyncio
+from collections import deque
+import itertools
 import logging
-from typing import Final, Optional
+import math
+import random
+import socket
+from typing import Callable, Final, Optional, Sequence
 
 from homeassistant.const import STATE_ON
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .stats import DolbyCP750Stats
 
 _LOGGER = logging.getLogger(__name__)
 
 # Domain
 DOMAIN: Final = "dolby_cp750"
 
+DEFAULT_NAME: Final = "Dolby CP750"
+DEFAULT_PORT: Final = 61408
+
+# Key of the shared connection manager in hass.data[DOMAIN]
+DATA_MANAGER: Final = "manager"
+
+# Key of the named presets in hass.data[DOMAIN]
+DATA_PRESETS: Final = "presets"
+
 # Available input sources
 INPUT_SOURCES: Final = {
     "analog": "Multi-Ch Analog",
@@ -22,95 +39,723 @@ INPUT_SOURCES: Final = {
     "non_sync": "NonSync"
 }
 
+# Services
+SERVICE_FADE_TO: Final = "fade_to"
+SERVICE_STOP_FADE: Final = "stop_fade"
+SERVICE_APPLY_PRESET: Final = "apply_preset"
+SERVICE_SAVE_PRESET: Final = "save_preset"
+SERVICE_DELETE_PRESET: Final = "delete_preset"
+
+ATTR_LEVEL: Final = "level"
+ATTR_DURATION: Final = "duration"
+ATTR_CURVE: Final = "curve"
+ATTR_PRESET: Final = "preset"
+ATTR_INPUT: Final = "input"
+ATTR_FADER: Final = "fader"
+ATTR_MUTE: Final = "mute"
+
+# Fade curves, mapping progress in [0, 1] to the share of the level change.
+# "log" moves quickly at first and eases into the target, which sounds more
+# even to the ear than a linear fader move.
+FADE_CURVES: Final[dict[str, Callable[[float], float]]] = {
+    "linear": lambda progress: progress,
+    "log": lambda progress: math.log10(1 + 9 * progress),
+}
+
+# Seconds between fader steps while fading
+FADE_STEP_INTERVAL: Final = 0.05
+
+# Seconds between fader state writes while fading, the steps in between
+# would only bloat the recorder
+FADE_RENDER_INTERVAL: Final = 1.0
+
+# Request priorities, lower values are sent first
+PRIORITY_WRITE: Final = 0
+PRIORITY_POLL: Final = 1
+
+# Seconds to wait for the device to answer a request
+RESPONSE_TIMEOUT: Final = 2.0
+
+# Seconds a query of a key the firmware may not know is waited for once
+# the rest of its batch has been answered
+PROBE_TIMEOUT: Final = 0.5
+
+# Seconds during which repeated writes to the same key are merged
+COALESCE_WINDOW: Final = 0.1
+
+# Seconds to wait for the TCP connection to be established
+CONNECT_TIMEOUT: Final = 5.0
+
+# Reconnect backoff after failed connection attempts, in seconds. The delay
+# doubles on every failure up to the maximum and is jittered so a fleet of
+# processors that went down together does not reconnect in lockstep.
+BACKOFF_INITIAL: Final = 1.0
+BACKOFF_MAX: Final = 300.0
+
+# After the power switch turns on, the processor needs a while to boot.
+# Connection attempts start after the delay and are retried every interval
+# until the window closes, then the normal backoff takes over.
+POWER_ON_BOOT_DELAY: Final = 5.0
+POWER_ON_BOOT_WINDOW: Final = 120.0
+POWER_ON_RETRY_INTERVAL: Final = 1.0
+
+# TCP keepalive on the session socket, in seconds: the kernel starts probing
+# after the idle time and drops the connection after count unanswered probes
+KEEPALIVE_IDLE: Final = 10
+KEEPALIVE_INTERVAL: Final = 5
+KEEPALIVE_COUNT: Final = 3
+
+# Seconds without any traffic from the device before the session is probed
+# with a query, so a half-open connection is found between polls. Profiles
+# with slower polls probe no more often than they poll the fast keys.
+IDLE_PROBE_INTERVAL: Final = 15.0
+
+# Last known state of every processor, restored at startup
+STORAGE_VERSION: Final = 1
+# Seconds between saving a changed state and writing it to disk
+STORAGE_SAVE_DELAY: Final = 10.0
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    """Mark a reply's failure as handled, callers may have stopped waiting."""
+    if not future.cancelled():
+        future.exception()
+
+
+def encode_command(command: str) -> tuple[str, bytes]:
+    """Return the key a command's reply echoes and the line to send."""
+    return command.split(" ", 1)[0], f"{command}\r\n".encode()
+
+
+# Query sent to probe an idle session
+_IDLE_PROBE: Final = encode_command("cp750.sys.fader ?")
+
+
+def _enable_keepalive(sock: Optional[socket.socket]) -> None:
+    """Turn on TCP keepalive, with short timers where the platform allows."""
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for option, value in (
+            ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+        ):
+            if hasattr(socket, option):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+    except OSError as err:
+        _LOGGER.debug("Could not enable TCP keepalive: %s", err)
+
+
 class DolbyCP750Protocol:
-    """Protocol handler for Dolby CP750."""
+    """Protocol handler for Dolby CP750.
+
+    Requests from the coordinator and from entities share one TCP session.
+    They go through a priority queue drained by a single writer task, while
+    a reader task routes every reply to the future waiting on its echoed key,
+    so concurrent callers can never read each other's responses.
 
-    def __init__(self, hass: HomeAssistant, host: str, port: int, power_switch: Optional[str] = None):
+    Failed connection attempts open a circuit breaker: until the backoff
+    delay has elapsed, requests fail immediately without touching the
+    network.
+
+    Dead sessions are found between requests, by TCP keepalive and by
+    probing a session that has been quiet for a while, and are replaced by
+    a background reconnect. Requests made meanwhile fail fast instead of
+    waiting for the reconnect.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        power_switch: Optional[str] = None,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        response_timeout: float = RESPONSE_TIMEOUT,
+    ):
         """Initialize the protocol handler."""
         self.hass = hass
         self.host = host
         self.port = port
         self._power_switch = power_switch
+        self._power_on = True
+        self._unsub_power_switch: Optional[Callable[[], None]] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._probe_task: Optional[asyncio.Task] = None
+        self._last_received = 0.0
+        self._connect_timeout = connect_timeout
+        # Seconds to wait for replies, adjustable while connected
+        self.response_timeout = response_timeout
+        # Seconds of silence before the session is probed, adjustable too
+        self.probe_interval = IDLE_PROBE_INTERVAL
+        self._failures = 0
+        self._retry_at = 0.0
         self._reader = None
         self._writer = None
         self._connected = False
+        self._connect_lock = asyncio.Lock()
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending: dict[str, deque[asyncio.Future]] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._listeners: list[Callable[[str], None]] = []
+        self._availability_listeners: list[Callable[[bool], None]] = []
+        self._coalesced_values: dict[str, str] = {}
+        self._coalesced_tasks: dict[str, asyncio.Task] = {}
+        self.stats = DolbyCP750Stats()
 
-    async def _check_power_switch(self) -> bool:
-        """Check if power switch is on (if configured)."""
-        if not self._power_switch:
-            return True
-        
-        power_state = self.hass.states.get(self._power_switch)
+    @property
+    def power_on(self) -> bool:
+        """Return True if the power switch is on (or none is configured)."""
+        return self._power_on
+
+    def _is_power_state_on(self, power_state: Optional[State]) -> bool:
+        """Return True if a power switch state lets the processor run."""
         if not power_state:
             _LOGGER.warning("Configured power switch %s not found", self._power_switch)
             return True
         
         return power_state.state == STATE_ON
 
+    @callback
+    def async_start(self) -> None:
+        """Start following the power switch, if one is configured."""
+        if not self._power_switch:
+            return
+
+        self._power_on = self._is_power_state_on(self.hass.states.get(self._power_switch))
+        self._unsub_power_switch = async_track_state_change_event(
+            self.hass, [self._power_switch], self._async_power_switch_changed
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the power switch."""
+        if self._unsub_power_switch:
+            self._unsub_power_switch()
+            self._unsub_power_switch = None
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+        self._async_cancel_reconnect()
+
+    @callback
+    def _async_power_switch_changed(self, event: Event) -> None:
+        """Disconnect on power-off, connect quickly on power-on."""
+        power_on = self._is_power_state_on(event.data["new_state"])
+        if power_on == self._power_on:
+            return
+        self._power_on = power_on
+
+        if self._warm_up_task:
+            self._warm_up_task.cancel()
+            self._warm_up_task = None
+
+        if power_on:
+            _LOGGER.debug("%s powered on, waiting for it to boot", self.host)
+            self._warm_up_task = self.hass.async_create_background_task(
+                self._async_warm_up(), f"{DOMAIN} {self.host} warm-up"
+            )
+        else:
+            _LOGGER.debug("%s powered off, disconnecting", self.host)
+            self.hass.async_create_task(self.disconnect())
+
+    @property
+    def warming_up(self) -> bool:
+        """Return True while waiting for the processor to boot."""
+        return self._warm_up_task is not None
+
+    @property
+    def reconnecting(self) -> bool:
+        """Return True while a lost session is being re-established."""
+        return self._reconnect_task is not None
+
+    @callback
+    def _async_schedule_reconnect(self) -> None:
+        """Re-establish a lost session in the background."""
+        if self._reconnect_task or self._warm_up_task or not self.power_on:
+            return
+        self._reconnect_task = self.hass.async_create_background_task(
+            self._async_reconnect(), f"{DOMAIN} {self.host} reconnect"
+        )
+
+    @callback
+    def _async_cancel_reconnect(self) -> None:
+        """Stop a background reconnect."""
+        if self._reconnect_task and self._reconnect_task is not asyncio.current_task():
+            self._reconnect_task.cancel()
+        self._reconnect_task = None
+
+    async def _async_reconnect(self) -> None:
+        """Reconnect until the session is back, honoring the backoff."""
+        try:
+            while self.power_on and not self._writer:
+                delay = self._retry_at - self.hass.loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self.stats.retries += 1
+                try:
+                    await self.connect()
+                except ConnectionError as err:
+                    _LOGGER.debug("Reconnecting to %s failed: %s", self.host, err)
+        finally:
+            if self._reconnect_task is asyncio.current_task():
+                self._reconnect_task = None
+
+    async def _async_probe_loop(self) -> None:
+        """Query the device whenever the session has been quiet for a while."""
+        loop = self.hass.loop
+        while True:
+            idle = loop.time() - self._last_received
+            if idle < self.probe_interval:
+                await asyncio.sleep(self.probe_interval - idle)
+                continue
+
+            try:
+                await self._async_submit([_IDLE_PROBE])
+            except (ConnectionError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Idle probe of %s failed: %s", self.host, err)
+                if isinstance(err, asyncio.TimeoutError):
+                    self._async_record_failure()
+                self._abort(ConnectionResetError("Idle probe failed"), reconnect=True)
+                return
+
+    async def _async_warm_up(self) -> None:
+        """Connect as soon as the processor has booted after power-on."""
+        try:
+            self._failures = 0
+            self._retry_at = 0.0
+            await asyncio.sleep(POWER_ON_BOOT_DELAY)
+            deadline = self.hass.loop.time() + POWER_ON_BOOT_WINDOW
+
+            while self.power_on:
+                async with self._connect_lock:
+                    if self._writer:
+                        return
+                    try:
+                        await self._async_open()
+                        _LOGGER.debug("%s is up", self.host)
+                        return
+                    except (OSError, asyncio.TimeoutError) as err:
+                        self.stats.connect_failures += 1
+                        _LOGGER.debug("%s not up yet: %s", self.host, err)
+
+                if self.hass.loop.time() >= deadline:
+                    _LOGGER.debug("%s did not come up after power-on", self.host)
+                    return
+                await asyncio.sleep(POWER_ON_RETRY_INTERVAL)
+        finally:
+            if self._warm_up_task is asyncio.current_task():
+                self._warm_up_task = None
+
+    async def _check_power_switch(self) -> bool:
+        """Check if power switch is on (if configured)."""
+        return self.power_on
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[str], None]) -> Callable[[], None]:
+        """Listen for messages the device sends without being asked.
+
+        The CP750 echoes state changes made elsewhere (e.g. the front panel
+        knob) on every open session. Returns a function that removes the
+        listener.
+        """
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_availability_listener(
+        self, update_callback: Callable[[bool], None]
+    ) -> Callable[[], None]:
+        """Listen for the connection going up or down.
+
+        Returns a function that removes the listener.
+        """
+        self._availability_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._availability_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _set_connected(self, connected: bool) -> None:
+        """Update the connection state and notify on transitions."""
+        if connected == self._connected:
+            return
+        self._connected = connected
+        for update_callback in list(self._availability_listeners):
+            update_callback(connected)
+
     @property
     def available(self) -> bool:
         """Return True if device is available."""
         return self._connected
 
+    @property
+    def circuit_open(self) -> bool:
+        """Return True while reconnecting is on hold after failures."""
+        return self.hass.loop.time() < self._retry_at
+
     async def connect(self) -> None:
         """Establish connection to the device."""
         if not await self._check_power_switch():
-            self._connected = False
+            self._set_connected(False)
             return
 
-        try:
-            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
-            self._connected = True
-        except Exception as err:
-            self._connected = False
-            raise ConnectionError(f"Failed to connect: {err}")
+        async with self._connect_lock:
+            if self._writer:
+                return
+
+            if self.circuit_open:
+                raise ConnectionError("Waiting to reconnect")
+
+            try:
+                await self._async_open()
+            except Exception as err:
+                self.stats.connect_failures += 1
+                self._async_record_failure()
+                self._set_connected(False)
+                raise ConnectionError(f"Failed to connect: {err}")
+
+    @callback
+    def _async_record_failure(self) -> None:
+        """Back off reconnecting after a failed connect or a silent session.
+
+        The backoff is only cleared by a reply, so a processor that accepts
+        connections but never answers opens the circuit like one that
+        refuses them.
+        """
+        self._failures += 1
+        delay = min(BACKOFF_MAX, BACKOFF_INITIAL * 2 ** (self._failures - 1))
+        delay = random.uniform(delay / 2, delay)
+        self._retry_at = self.hass.loop.time() + delay
+        _LOGGER.debug(
+            "Connection to %s failed %d times, retrying in %.1fs",
+            self.host, self._failures, delay,
+        )
+
+    async def _async_open(self) -> None:
+        """Open the session and start its reader and writer tasks."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            timeout=self._connect_timeout,
+        )
+
+        _enable_keepalive(writer.get_extra_info("socket"))
+        self.stats.connects += 1
+        self._last_received = self.hass.loop.time()
+        self._reader, self._writer = reader, writer
+        self._set_connected(True)
+        self._reader_task = self.hass.async_create_background_task(
+            self._async_read_loop(reader), f"{DOMAIN} {self.host} reader"
+        )
+        self._writer_task = self.hass.async_create_background_task(
+            self._async_write_loop(writer), f"{DOMAIN} {self.host} writer"
+        )
+        self._probe_task = self.hass.async_create_background_task(
+            self._async_probe_loop(), f"{DOMAIN} {self.host} idle probe"
+        )
 
     async def disconnect(self) -> None:
         """Close the connection."""
+        writer = self._writer
+        self._async_cancel_reconnect()
+        self._abort(ConnectionResetError("Disconnected"))
+        if writer:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _abort(self, err: Exception, reconnect: bool = False) -> None:
+        """Tear down the session and fail every outstanding request.
+
+        reconnect=True re-establishes a session that was lost rather than
+        closed on purpose.
+        """
+        current = asyncio.current_task()
+        for task in (self._reader_task, self._writer_task, self._probe_task):
+            if task and task is not current:
+                task.cancel()
+        self._reader_task = None
+        self._writer_task = None
+        self._probe_task = None
+
         if self._writer:
             self._writer.close()
-            await self._writer.wait_closed()
-            self._writer = None
-            self._reader = None
-        self._connected = False
+        self._writer = None
+        self._reader = None
+        self._set_connected(False)
+
+        # Requests already written are waiting for a reply that won't come
+        for waiters in self._pending.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(err)
+        self._pending.clear()
+
+        # Requests still queued were never sent
+        while not self._queue.empty():
+            _, _, _, futures = self._queue.get_nowait()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(err)
+
+        if reconnect:
+            self._async_schedule_reconnect()
+
+    async def _async_write_loop(self, writer: asyncio.StreamWriter) -> None:
+        """Send queued requests, highest priority first."""
+        while True:
+            _, _, requests, futures = await self._queue.get()
+
+            # Skip requests whose caller already gave up
+            live = [
+                (request, future)
+                for request, future in zip(requests, futures)
+                if not future.done()
+            ]
+            if not live:
+                continue
+
+            for (key, _), future in live:
+                self._pending.setdefault(key, deque()).append(future)
+
+            payload = b"".join(line for (_, line), _ in live)
+            self.stats.bytes_sent += len(payload)
+            try:
+                writer.write(payload)
+                await writer.drain()
+            except OSError as err:
+                _LOGGER.debug("Write to %s failed: %s", self.host, err)
+                self._abort(ConnectionResetError(f"Write failed: {err}"), reconnect=True)
+                return
+
+    async def _async_read_loop(self, reader: asyncio.StreamReader) -> None:
+        """Route every reply to the request waiting on its key."""
+        try:
+            while True:
+                response = await reader.readline()
+                if not response:
+                    break
+
+                self._last_received = self.hass.loop.time()
+                if self._failures:
+                    # The session works, the backoff is over
+                    self._failures = 0
+                    self._retry_at = 0.0
+                self.stats.bytes_received += len(response)
+                response_text = response.decode().strip()
+                if response_text:
+                    self._async_dispatch(response_text)
+        except OSError as err:
+            _LOGGER.debug("Read from %s failed: %s", self.host, err)
+
+        self._abort(ConnectionResetError("Connection closed by device"), reconnect=True)
+
+    def _async_dispatch(self, response_text: str) -> None:
+        """Resolve the oldest pending request for the reply's key."""
+        key = response_text.split(" ", 1)[0]
+        waiters = self._pending.get(key)
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                future.set_result(response_text)
+                return
+
+        _LOGGER.debug("Unsolicited message from %s: %s", self.host, response_text)
+        for update_callback in list(self._listeners):
+            update_callback(response_text)
+
+    async def _async_submit(
+        self,
+        requests: Sequence[tuple[str, bytes]],
+        probes: Sequence[tuple[str, bytes]] = (),
+    ) -> list[Optional[str]]:
+        """Queue requests as one pipelined write and wait for their replies.
+
+        Probes are sent after the requests but only waited for PROBE_TIMEOUT
+        once the requests are answered.
+        """
+        if not self._writer:
+            # Never wait for a reconnect inline
+            if self._reconnect_task:
+                raise ConnectionError("Reconnecting")
+            await self.connect()
+        if not self._writer:
+            raise ConnectionError("Not connected")
+
+        split = len(requests)
+        requests = [*requests, *probes]
+
+        # Writes always jump ahead of polls
+        priority = PRIORITY_POLL
+        if any(not line.endswith(b"?\r\n") for _, line in requests):
+            priority = PRIORITY_WRITE
+
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in requests]
+        for future in futures:
+            future.add_done_callback(_retrieve_exception)
+        start = loop.time()
+        self._queue.put_nowait((priority, next(self._sequence), requests, futures))
+
+        await asyncio.wait(futures[:split] or futures, timeout=self.response_timeout)
+        if late := [future for future in futures[split:] if not future.done()]:
+            await asyncio.wait(late, timeout=PROBE_TIMEOUT)
+        done = {future for future in futures if future.done()}
+        for future in futures:
+            if future not in done:
+                future.cancel()
+        if not done:
+            self.stats.timeouts += 1
+            raise asyncio.TimeoutError
+
+        for future in done:
+            if future.exception():
+                raise future.exception()
+
+        # Keys the firmware doesn't answer come back as None, as long as the
+        # device answered the rest of the batch
+        responses = [future.result() if future in done else None for future in futures]
+        self.stats.record_rtt(loop.time() - start)
+        return responses
+
+    async def _async_request(
+        self,
+        requests: Sequence[tuple[str, bytes]],
+        check_power: bool = True,
+        probes: Sequence[tuple[str, bytes]] = (),
+    ) -> list[Optional[str]]:
+        """Send requests, replacing the session if they fail."""
+        if check_power and not await self._check_power_switch():
+            self._set_connected(False)
+            raise ConnectionError("Device is powered off")
+
+        # Circuit breaker: don't touch the network until the backoff expires
+        if not self._writer and self.circuit_open:
+            raise ConnectionError("Waiting to reconnect")
+
+        try:
+            return await self._async_submit(requests, probes)
+        except Exception as err:
+            self.stats.errors += 1
+            if isinstance(err, asyncio.TimeoutError):
+                # A session that doesn't answer counts like a failed connect
+                self._async_record_failure()
+            if self._writer:
+                # Replace the stalled session in the background
+                self._abort(ConnectionResetError(f"Request failed: {err}"), reconnect=True)
+            raise ConnectionError(f"Command failed: {err}")
 
     async def send_command(self, command: str) -> str:
         """Send command and return response."""
-        if not await self._check_power_switch():
-            self._connected = False
-            raise ConnectionError("Device is powered off")
+        responses = await self._async_request([encode_command(command)])
+        return responses[0]
+
+    async def send_batch(self, commands: list[str]) -> list[Optional[str]]:
+        """Send several commands in one write and return their responses.
+
+        All commands are pipelined in a single write and each reply is
+        matched to its command by the echoed key, so one batch costs one
+        network round trip regardless of its size. Commands left unanswered
+        when the timeout expires get None, unless nothing was answered at
+        all, which is a timeout.
+        """
+        return await self._async_request([encode_command(command) for command in commands])
+
+    async def send_prepared(
+        self,
+        requests: Sequence[tuple[str, bytes]],
+        check_power: bool = True,
+        probes: Sequence[tuple[str, bytes]] = (),
+    ) -> list[Optional[str]]:
+        """Send a batch of pre-encoded requests, see encode_command.
 
+        Same as send_batch, for callers that encode their queries once and
+        reuse them on every poll. check_power=False skips the power switch
+        check for callers that already made it. Queries of keys the firmware
+        may not know go in probes, whose replies follow those of requests.
+        """
+        return await self._async_request(requests, check_power, probes)
+
+    async def send_coalesced(self, key: str, value: str) -> str:
+        """Write a value, merging rapid writes to the same key.
+
+        Writes arriving within COALESCE_WINDOW of each other are merged and
+        only the latest value is sent, so a slider drag doesn't flood the
+        link. The last value is always sent: every caller returns once a
+        value at least as recent as its own has been written, with the
+        device's reply to it.
+        """
+        self._coalesced_values[key] = value
+        task = self._coalesced_tasks.get(key)
+        if task is None:
+            task = self.hass.async_create_background_task(
+                self._async_flush_coalesced(key), f"{DOMAIN} {self.host} {key} write"
+            )
+            self._coalesced_tasks[key] = task
+        return await asyncio.shield(task)
+
+    def write_pending(self, key: str) -> bool:
+        """Return True if a coalesced write to key is waiting to be sent."""
+        return key in self._coalesced_values
+
+    async def _async_flush_coalesced(self, key: str) -> str:
+        """Send the latest value for key until no newer one is waiting."""
         try:
-            # Se non siamo connessi, proviamo a connetterci
-            if not self._writer:
-                await self.connect()
+            while True:
+                await asyncio.sleep(COALESCE_WINDOW)
+                value = self._coalesced_values.pop(key)
+                response = await self.send_command(f"{key} {value}")
+                if key not in self._coalesced_values:
+                    return response
+        finally:
+            self._coalesced_values.pop(key, None)
+            self._coalesced_tasks.pop(key, None)
 
-            # Send command with newline
-            self._writer.write(f"{command}\r\n".encode())
-            await self._writer.drain()
+    async def fade(
+        self,
+        key: str,
+        start: float,
+        target: float,
+        duration: float,
+        curve: str = "linear",
+        step_callback: Optional[Callable[[int], None]] = None,
+    ) -> None:
+        """Move a level from start to target over duration seconds.
 
-            # Read response
-            response = await asyncio.wait_for(self._reader.readline(), timeout=2.0)
-            response_text = response.decode().strip()
-        
-            # Se la risposta è vuota, riconnettiamo e riproviamo una volta
-            if not response_text:
-                _LOGGER.debug("Empty response received, trying to reconnect...")
-                await self.disconnect()
-                await self.connect()
-
-                self._writer.write(f"{command}\r\n".encode())
-                await self._writer.drain()
-            
-                response = await asyncio.wait_for(self._reader.readline(), timeout=2.0)
-                response_text = response.decode().strip()
+        Steps are streamed over the open session every FADE_STEP_INTERVAL,
+        timed against the loop clock so slow replies don't stretch the fade.
+        Only whole-number changes are sent. Cancel the calling task to stop
+        the fade where it is.
+        """
+        shape = FADE_CURVES[curve]
+        begin = self.hass.loop.time()
+        last_level = round(start)
 
-                if not response_text:
-                    raise ConnectionError("No response from device after retry")
+        while True:
+            elapsed = self.hass.loop.time() - begin
+            progress = min(1.0, elapsed / duration) if duration > 0 else 1.0
+            level = round(start + (target - start) * shape(progress))
 
-            self._connected = True
-            return response_text
-        except Exception as err:
-            self._connected = False
-            await self.disconnect()
-            raise ConnectionError(f"Command failed: {err}")            
\ No newline at end of file
+            if level != last_level:
+                await self.send_command(f"{key} {level}")
+                last_level = level
+                if step_callback:
+                    step_callback(level)
+
+            if progress >= 1.0:
+                return
+            await asyncio.sleep(FADE_STEP_INTERVAL)
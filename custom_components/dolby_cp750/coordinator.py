@@ -1,17 +1,61 @@
 """Data update coordinator for Dolby CP750."""
-from datetime import timedelta
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
 import logging
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     CoordinatorEntity,
+    UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, DolbyCP750Protocol
+from .const import (
+    COALESCE_WINDOW,
+    DOMAIN,
+    IDLE_PROBE_INTERVAL,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    DolbyCP750Protocol,
+)
+from .parser import DATA_KEYS, POLL_COMMANDS, QUERIES, parse_message, parse_response
+from .profiles import PROFILES, PollProfile, Profile
+from .registry import KEYS, KEYS_BY_DATA_KEY, OPTIONAL_KEYS, POLL_INTERVALS, PollClass
+from .schedule import DolbyCP750Schedule
+from .state import DolbyCP750State
 
 _LOGGER = logging.getLogger(__name__)
 
+# The coordinator ticks at the fastest poll interval and only queries the
+# keys that are due. A key that just changed or was just written is polled
+# at the fastest rate of its poll class; a stable key backs off
+# exponentially up to the ceiling of its class. State changes made on the
+# device are pushed anyway, so slow polling is only a consistency check.
+# The bounds of each poll class come from the processor's profile, see
+# profiles.py.
+MIN_POLL_INTERVAL = POLL_INTERVALS[PollClass.FAST][0]
+
+# Consecutive polls without a reply before an optional key is considered
+# unsupported by the processor firmware. It is then only probed again every
+# RETIRED_PROBE_INTERVAL and on every new session. Other keys are never
+# retired, a missed reply just polls them again on the next tick.
+MAX_MISSED_REPLIES = 3
+RETIRED_PROBE_INTERVAL = 6 * 60 * 60
+
+# Key every firmware answers, sent along with batches of keys that may not be
+ANCHOR_KEY = "fader"
+
+# Seconds between summaries while a processor stays unreachable. The start
+# of an outage and its end are logged once each.
+OUTAGE_REPORT_INTERVAL = 15 * 60
+
+
 class DolbyCP750Coordinator(DataUpdateCoordinator):
     """Class to manage fetching data from Dolby CP750."""
 
@@ -19,39 +63,605 @@ class DolbyCP750Coordinator(DataUpdateCoordinator):
         self, 
         hass: HomeAssistant, 
         protocol: DolbyCP750Protocol,
-        name: str
+        name: str,
+        entry_id: str,
+        profile: PollProfile = PROFILES[Profile.STANDARD],
+        show_schedule: DolbyCP750Schedule | None = None,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"{name} Coordinator",
-            update_interval=timedelta(seconds=1),  # Polling ogni secondo
+            # Polls are driven by DolbyCP750Manager, one tick per MIN_POLL_INTERVAL
+            update_interval=None,
         )
         self.protocol = protocol
-        self.data = {}
+        self.data = DolbyCP750State()
+        # Data keys whose value changed in the latest update
+        self.changed_keys: set[str] = set()
+        # Set while the entities render values restored from the last run
+        self.stale_since: datetime | None = None
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        # Data key -> ISO timestamp of the last change read from the device
+        self._changed_at: dict[str, str] = {}
+        # Data key -> value before an optimistic write the device hasn't
+        # confirmed yet
+        self._unconfirmed: dict[str, Any] = {}
+        self._fade_task: asyncio.Task | None = None
+        # Written keys waiting to be read back, see _async_request_verify
+        self._verify_keys: set[str] = set()
+        self._verify_task: asyncio.Task | None = None
+        self._interval_bounds: dict[str, tuple[float, float]] = {}
+        self._poll_intervals: dict[str, float] = {}
+        self._next_poll: dict[str, float] = {}
+        self._missed_replies: dict[str, int] = {}
+        self._unsupported: set[str] = set()
+        # Optional keys the firmware has answered, polled like any other key
+        self._verified: set[str] = set()
+        # Loop time the current outage started, see _async_track_failure
+        self._outage_start: float | None = None
+        self._outage_reported = 0.0
+        self._outage_failures = 0
+        self._profile = profile
+        self._show_schedule: DolbyCP750Schedule | None = None
+        self.async_set_show_schedule(show_schedule)
+        self._async_reset_schedule()
+        self._unsub_protocol = protocol.async_add_listener(self._async_handle_message)
+        self._unsub_availability = protocol.async_add_availability_listener(
+            self._async_handle_availability
+        )
+
+    @property
+    def stale(self) -> bool:
+        """Return True until the restored state is confirmed by the device."""
+        return self.stale_since is not None
+
+    async def async_restore(self) -> None:
+        """Serve the state saved by the last run until fresh data comes in."""
+        stored = await self._store.async_load()
+        if not stored or self._changed_at:
+            # Nothing saved, or the device already answered
+            return
+
+        restored = self.data.restore(stored.get("values", {}))
+        if not restored:
+            return
+
+        self._changed_at.update(stored.get("changed_at", {}))
+        self.stale_since = dt_util.parse_datetime(stored["saved_at"])
+        self.changed_keys.update(restored)
+        _LOGGER.debug(
+            "Restored %d values of %s saved at %s",
+            len(restored), self.protocol.host, stored["saved_at"],
+        )
+
+    @callback
+    def _async_data_to_store(self) -> dict[str, Any]:
+        """Return the state to persist."""
+        return {
+            "saved_at": dt_util.utcnow().isoformat(),
+            # Optimistic values are only saved once the device confirms them
+            "values": {**self.data.as_dict(), **self._unconfirmed},
+            "changed_at": self._changed_at,
+        }
+
+    @callback
+    def _async_live_update(self) -> None:
+        """Record fresh data from the device and schedule saving it."""
+        self.stale_since = None
+        if not self.changed_keys:
+            return
+
+        now = dt_util.utcnow().isoformat()
+        for data_key in self.changed_keys:
+            self._changed_at[data_key] = now
+        self._store.async_delay_save(self._async_data_to_store, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_set_profile(self, profile: PollProfile) -> None:
+        """Use a new profile during shows, or all the time without a schedule."""
+        self._profile = profile
+        self._async_apply_profile()
+
+    @callback
+    def async_set_show_schedule(self, show_schedule: DolbyCP750Schedule | None) -> None:
+        """Follow a show schedule, polling at the idle profile outside shows."""
+        if self._show_schedule is not None:
+            self._show_schedule.async_stop()
+        self._show_schedule = show_schedule
+        if show_schedule is not None:
+            show_schedule.async_start(self._async_show_changed)
+        self._async_apply_profile()
+
+    @property
+    def fading(self) -> bool:
+        """Return True while a fade runs."""
+        return self._fade_task is not None
+
+    @property
+    def in_show(self) -> bool:
+        """Return True during a show, or always without a show schedule."""
+        return self._show_schedule is None or self._show_schedule.in_show
+
+    @callback
+    def _async_show_changed(self, in_show: bool) -> None:
+        """Switch profiles as a show window opens or closes."""
+        _LOGGER.debug(
+            "%s %s a show window", self.protocol.host, "entering" if in_show else "leaving"
+        )
+        self._async_apply_profile()
+        if not in_show:
+            return
+
+        # Pre-warm: connect and read everything before the show starts
+        self._async_reset_schedule()
+        protocol = self.protocol
+        if protocol.power_on and not (
+            protocol.available or protocol.reconnecting or protocol.warming_up
+        ):
+            self.hass.async_create_background_task(
+                self._async_prewarm(), f"{DOMAIN} {protocol.host} pre-warm"
+            )
+
+    async def _async_prewarm(self) -> None:
+        """Open the session ahead of a show."""
+        try:
+            await self.protocol.connect()
+        except ConnectionError as err:
+            _LOGGER.debug("Pre-warming %s failed: %s", self.protocol.host, err)
+
+    @callback
+    def _async_apply_profile(self) -> None:
+        """Apply the poll intervals and reply timeout of the current profile.
+
+        Nothing reconnects, and keys already scheduled are pulled into the
+        new bounds right away.
+        """
+        profile = self._profile if self.in_show else PROFILES[Profile.IDLE]
+        self.protocol.response_timeout = profile.response_timeout
+        # Probing more often than the fast keys are polled would undo the
+        # round trips a slow profile saves
+        self.protocol.probe_interval = max(
+            IDLE_PROBE_INTERVAL,
+            profile.intervals[PollClass.FAST][1].total_seconds(),
+        )
+        for key in KEYS:
+            fastest, slowest = profile.intervals[key.poll_class]
+            self._interval_bounds[key.data_key] = (
+                fastest.total_seconds(),
+                slowest.total_seconds(),
+            )
+
+        now = self.hass.loop.time()
+        for data_key, interval in self._poll_intervals.items():
+            if data_key in self._unsupported:
+                continue
+            min_interval, max_interval = self._interval_bounds[data_key]
+            interval = min(max(interval, min_interval), max_interval)
+            self._poll_intervals[data_key] = interval
+            self._next_poll[data_key] = min(self._next_poll[data_key], now + interval)
+
+    @callback
+    def _async_reset_schedule(self) -> None:
+        """Make every key due on the next tick, retired keys included."""
+        for data_key in POLL_COMMANDS:
+            self._poll_intervals[data_key] = self._interval_bounds[data_key][0]
+            self._next_poll[data_key] = 0.0
+
+    @property
+    def poll_intervals(self) -> dict[str, float]:
+        """Return the current poll interval of every key, in seconds."""
+        return dict(self._poll_intervals)
+
+    @callback
+    def _async_mark_active(self, data_key: str) -> None:
+        """Poll a key that just changed or was written at the fastest rate."""
+        if data_key not in self._next_poll:
+            return
+        min_interval = self._interval_bounds[data_key][0]
+        self._poll_intervals[data_key] = min_interval
+        self._next_poll[data_key] = self.hass.loop.time() + min_interval
+
+    @callback
+    def _async_handle_message(self, message: str) -> None:
+        """Apply a state change pushed by the device."""
+        parsed = parse_message(message)
+        if parsed is None:
+            return
+
+        data_key, value = parsed
+        if self.data.get(data_key) == value and data_key not in self._unconfirmed:
+            return
+
+        self._async_mark_active(data_key)
+        self._async_apply(data_key, value)
+
+    @callback
+    def _async_apply(self, data_key: str, value: Any, confirmed: bool = True) -> None:
+        """Store a value outside a poll and notify the entities rendering it.
+
+        Values not read from the device (optimistic writes, fade steps) are
+        rendered but keep the current staleness, and are neither stamped
+        nor saved until the device confirms them.
+        """
+        if confirmed:
+            changed = self._set_confirmed(data_key, value)
+        else:
+            self._unconfirmed.setdefault(data_key, self.data.get(data_key))
+            changed = self.data.set(data_key, value)
+        if not changed:
+            return
+        self.changed_keys.clear()
+        self.changed_keys.add(data_key)
+        if confirmed:
+            self._async_live_update()
+        self.async_set_updated_data(self.data)
+
+    def _set_confirmed(self, data_key: str, value: Any) -> bool:
+        """Store a value read from the device, returning True if it is news.
+
+        A value rendered optimistically is news once the device confirms it,
+        even though it is already stored.
+        """
+        changed = self.data.set(data_key, value)
+        if data_key in self._unconfirmed:
+            del self._unconfirmed[data_key]
+            return True
+        return changed
+
+    @callback
+    def _async_handle_availability(self, available: bool) -> None:
+        """Track the connection going up or down.
+
+        Entities are marked unavailable as soon as the session drops, and a
+        session coming back (e.g. after power-on) is polled right away.
+        """
+        if available:
+            if not self.last_update_success:
+                self.hass.async_create_task(self.async_request_refresh())
+            return
+
+        # Re-read everything once the session is back
+        self._async_reset_schedule()
+        if self.last_update_success:
+            self.last_update_success = False
+            self.changed_keys.clear()
+            self.async_update_listeners()
+
+    async def async_send_command(self, command: str) -> None:
+        """Send a write command and confirm it from the device's echo.
+
+        No refresh is requested: the key is polled closely until it settles,
+        and read back right away only if the device didn't echo it.
+        """
+        response = await self.protocol.send_command(command)
+
+        parsed = parse_message(command)
+        if parsed is not None:
+            self._async_confirm_writes([(parsed[0], response)])
+
+    async def async_write_coalesced(self, data_key: str, value: Any, raw_value: str) -> None:
+        """Write a value optimistically, merging rapid writes to the same key.
+
+        The new value is rendered right away and confirmed by the device's
+        echo, a pushed notification or the next poll, so no refresh is
+        requested after the write.
+        """
+        self._async_apply(data_key, value, confirmed=False)
+
+        key = DATA_KEYS[data_key]
+        response = await self.protocol.send_coalesced(key, raw_value)
+        self._async_mark_active(data_key)
+
+        # The echo reflects what the device actually applied
+        try:
+            confirmed = parse_response(data_key, response)
+        except ValueError:
+            return
+        if not self.protocol.write_pending(key):
+            self._async_apply(data_key, confirmed)
+
+    async def async_write_burst(self, writes: list[tuple[str, str]]) -> None:
+        """Write several keys in one pipelined burst.
+
+        writes holds (data key, raw value) pairs, sent in order. Keys are
+        updated from the device's echoes, so entities render what it
+        actually applied; keys left unechoed are read back together.
+        """
+        if not writes:
+            return
+        if any(data_key == "fader" for data_key, _ in writes):
+            self.async_stop_fade()
+
+        responses = await self.protocol.send_batch(
+            [f"{DATA_KEYS[data_key]} {raw_value}" for data_key, raw_value in writes]
+        )
+        self._async_confirm_writes(
+            [(data_key, response) for (data_key, _), response in zip(writes, responses)]
+        )
+
+    def _parse_reply(self, data_key: str, response: str | None) -> Any:
+        """Parse a reply to a write or a read, None if missing or invalid."""
+        if response is None:
+            return None
+        try:
+            return parse_response(data_key, response)
+        except ValueError as err:
+            _LOGGER.debug("Invalid response from %s: %s", self.protocol.host, err)
+            return None
+
+    @callback
+    def _async_confirm_writes(self, replies: list[tuple[str, str | None]]) -> None:
+        """Apply the echoes of writes and read back the keys left unconfirmed.
+
+        The echo already holds the value the device applied, so an echoed
+        write needs no refresh at all.
+        """
+        self.changed_keys.clear()
+        for data_key, response in replies:
+            self._async_mark_active(data_key)
+            value = self._parse_reply(data_key, response)
+            if value is None:
+                self._async_request_verify(data_key)
+            elif self._set_confirmed(data_key, value):
+                self.changed_keys.add(data_key)
+
+        if self.changed_keys:
+            self._async_live_update()
+            self.async_set_updated_data(self.data)
+
+    @callback
+    def _async_request_verify(self, data_key: str) -> None:
+        """Read back a written key, merged with the other pending read-backs."""
+        self._verify_keys.add(data_key)
+        if self._verify_task is None:
+            self._verify_task = self.hass.async_create_background_task(
+                self._async_verify(), f"{DOMAIN} {self.protocol.host} verify"
+            )
+
+    async def _async_verify(self) -> None:
+        """Read every pending written key in one pipelined request."""
+        try:
+            # Let a burst of writes gather before reading them back
+            await asyncio.sleep(COALESCE_WINDOW)
+            data_keys = list(self._verify_keys)
+            self._verify_keys.clear()
+
+            try:
+                responses = await self.protocol.send_prepared(
+                    [QUERIES[data_key] for data_key in data_keys]
+                )
+            except Exception as err:
+                _LOGGER.debug("Read-back from %s failed: %s", self.protocol.host, err)
+                # Leave them to the next poll
+                for data_key in data_keys:
+                    if data_key in self._next_poll:
+                        self._next_poll[data_key] = 0.0
+                return
+
+            self.changed_keys.clear()
+            for data_key, response in zip(data_keys, responses):
+                value = self._parse_reply(data_key, response)
+                if value is not None and self._set_confirmed(data_key, value):
+                    self.changed_keys.add(data_key)
+
+            if self.changed_keys:
+                self._async_live_update()
+                self.async_set_updated_data(self.data)
+        finally:
+            self._verify_task = None
+            # Keys written while the read was in flight get their own read
+            if self._verify_keys:
+                self._async_request_verify(self._verify_keys.pop())
+
+    async def async_fade_fader(self, level: float, duration: float, curve: str) -> None:
+        """Fade the fader to level and wait until the fade ends or is stopped."""
+        self.async_stop_fade()
+
+        start = self.data.get("fader")
+        if start is None:
+            raise HomeAssistantError("Current fader level is unknown")
+
+        @callback
+        def _async_step(step: int) -> None:
+            self._async_apply("fader", float(step), confirmed=False)
+
+        self._fade_task = self.hass.async_create_background_task(
+            self.protocol.fade(DATA_KEYS["fader"], start, level, duration, curve, _async_step),
+            f"{DOMAIN} {self.protocol.host} fade",
+        )
+        task = self._fade_task
+        await asyncio.wait([task])
+        if self._fade_task is task:
+            self._fade_task = None
+        if not task.cancelled() and task.exception():
+            raise HomeAssistantError(f"Fade failed: {task.exception()}")
+        self._async_mark_active("fader")
+
+    @callback
+    def async_stop_fade(self) -> None:
+        """Stop a running fade where it is."""
+        if self._fade_task is not None:
+            self._fade_task.cancel()
+            self._fade_task = None
+
+    async def async_shutdown(self) -> None:
+        """Stop listening for pushed state changes and close the session."""
+        self.async_stop_fade()
+        if self._show_schedule is not None:
+            self._show_schedule.async_stop()
+        self._verify_keys.clear()
+        if self._verify_task is not None:
+            self._verify_task.cancel()
+        await super().async_shutdown()
+        self._unsub_protocol()
+        self._unsub_availability()
+        self.protocol.async_stop()
+        await self.protocol.disconnect()
+        if not self.stale:
+            await self._store.async_save(self._async_data_to_store())
+
+    @callback
+    def _async_handle_missed_reply(self, data_key: str) -> None:
+        """Retire an optional key the processor keeps leaving unanswered."""
+        if data_key not in OPTIONAL_KEYS:
+            return
+        missed = self._missed_replies.get(data_key, 0) + 1
+        self._missed_replies[data_key] = missed
+        if missed < MAX_MISSED_REPLIES and data_key not in self._unsupported:
+            return
+
+        if data_key not in self._unsupported:
+            _LOGGER.info(
+                "%s does not answer %s, probing it every %d h only",
+                self.protocol.host, POLL_COMMANDS[data_key],
+                RETIRED_PROBE_INTERVAL // 3600,
+            )
+            self._unsupported.add(data_key)
+            self._verified.discard(data_key)
+        self._next_poll[data_key] = self.hass.loop.time() + RETIRED_PROBE_INTERVAL
+
+    @callback
+    def _async_track_failure(self, err: Exception) -> None:
+        """Count a failed poll, summarizing long outages now and then."""
+        if not self.protocol.power_on:
+            # A processor switched off is not an outage
+            self._outage_start = None
+            return
+
+        now = self.hass.loop.time()
+        if self._outage_start is None:
+            self._outage_start = self._outage_reported = now
+            self._outage_failures = 1
+            # DataUpdateCoordinator only logs the first failure after a
+            # success, and a dropped session already cleared that
+            if not self.last_update_success:
+                _LOGGER.warning("%s unreachable: %s", self.protocol.host, err)
+            return
+
+        self._outage_failures += 1
+        if now - self._outage_reported >= OUTAGE_REPORT_INTERVAL:
+            self._outage_reported = now
+            _LOGGER.warning(
+                "%s unreachable for %d min, %d failed polls",
+                self.protocol.host, (now - self._outage_start) // 60, self._outage_failures,
+            )
+
+    @callback
+    def _async_track_success(self) -> None:
+        """Close an outage with its totals."""
+        if self._outage_start is None:
+            return
+        _LOGGER.info(
+            "%s was unreachable for %d min, %d failed polls",
+            self.protocol.host,
+            (self.hass.loop.time() - self._outage_start) // 60,
+            self._outage_failures,
+        )
+        self._outage_start = None
 
     async def _async_update_data(self):
-        """Fetch data from CP750."""
+        """Fetch data from CP750.
+
+        Failures surface as UpdateFailed, which DataUpdateCoordinator logs
+        once per transition; an outage costs a summary every
+        OUTAGE_REPORT_INTERVAL instead of a log line per poll.
+        """
         try:
-            # Fetch control data
-            fader = await self.protocol.send_command("cp750.sys.fader ?")
-            input_mode = await self.protocol.send_command("cp750.sys.input_mode ?")
-            mute = await self.protocol.send_command("cp750.sys.mute ?")
-
-            # Parse control data
-            data = {
-                "fader": float(fader.split()[1]) if len(fader.split()) >= 2 else None,
-                "input": input_mode.split()[1] if len(input_mode.split()) >= 2 else None,
-                "mute": mute.split()[1] == "1" if len(mute.split()) >= 2 else None,
-            }
-
-            # Fetch digital inputs validity
-            for i in range(1, 5):
-                response = await self.protocol.send_command(f"cp750.state.dig_{i}_valid ?")
-                data[f"dig_{i}_valid"] = response.split()[1] == "1" if len(response.split()) >= 2 else None
-
-            return data
+            data = await self._async_poll()
+        except UpdateFailed as err:
+            self._async_track_failure(err)
+            raise
         except Exception as err:
-            _LOGGER.error("Error updating data: %s", err)
-            raise
\ No newline at end of file
+            self._async_track_failure(err)
+            raise UpdateFailed(err) from err
+
+        self._async_track_success()
+        return data
+
+    async def _async_poll(self) -> DolbyCP750State:
+        """Fetch the keys that are due."""
+        self.changed_keys.clear()
+
+        # The power switch is checked once per poll, not once per query
+        if not self.protocol.power_on:
+            # Nothing to poll until the processor is powered again
+            self._async_reset_schedule()
+            if self.protocol.available:
+                await self.protocol.disconnect()
+            raise UpdateFailed("Device is powered off")
+
+        if self.protocol.warming_up and not self.protocol.available:
+            # Connecting is handled by the power-on warm-up
+            raise UpdateFailed("Waiting for the device to boot")
+
+        if self.protocol.reconnecting and not self.protocol.available:
+            # The lost session is being re-established in the background
+            raise UpdateFailed("Reconnecting")
+
+        if self.protocol.circuit_open:
+            # Reconnect backoff in progress, don't spend a poll on it
+            raise UpdateFailed("Waiting to reconnect")
+
+        now = self.hass.loop.time()
+        due = [data_key for data_key, when in self._next_poll.items() if when <= now]
+        if not due:
+            return self.data
+
+        # Optional keys the firmware hasn't answered yet are only probed, so
+        # they can't hold up the rest of the poll
+        probing = [
+            data_key
+            for data_key in due
+            if data_key in OPTIONAL_KEYS and data_key not in self._verified
+        ]
+        regular = [data_key for data_key in due if data_key not in probing]
+
+        # Fetch every due key in a single pipelined round trip
+        queries = [QUERIES[data_key] for data_key in regular]
+        anchored = all(
+            KEYS_BY_DATA_KEY[data_key].poll_class is not PollClass.FAST for data_key in regular
+        )
+        if anchored:
+            # The fader rides along so that a batch the firmware ignores
+            # comes back as missed replies rather than a timeout that
+            # drops the session
+            queries.append(QUERIES[ANCHOR_KEY])
+        responses = await self.protocol.send_prepared(
+            queries, check_power=False, probes=[QUERIES[data_key] for data_key in probing]
+        )
+        if anchored:
+            del responses[len(regular)]
+
+        data = self.data
+        for data_key, response in zip(regular + probing, responses):
+            if response is None:
+                self._async_handle_missed_reply(data_key)
+                continue
+            self._missed_replies.pop(data_key, None)
+            if data_key in OPTIONAL_KEYS:
+                self._verified.add(data_key)
+                self._unsupported.discard(data_key)
+
+            try:
+                value = parse_response(data_key, response)
+            except ValueError as err:
+                # Keep the last value, the key is still due on the next tick
+                _LOGGER.debug("Invalid response from %s: %s", self.protocol.host, err)
+                continue
+
+            # Back off keys that did not change, stay fast on those that did
+            min_interval, max_interval = self._interval_bounds[data_key]
+            if self._set_confirmed(data_key, value):
+                interval = min_interval
+                self.changed_keys.add(data_key)
+            else:
+                interval = min(self._poll_intervals[data_key] * 2, max_interval)
+            self._poll_intervals[data_key] = interval
+            self._next_poll[data_key] = now + interval
+
+        self._async_live_update()
+        return data
@@ -0,0 +1,32 @@
+"""Diagnostics support for Dolby CP750."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_MANAGER, DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    protocol = coordinator.protocol
+    manager = hass.data[DOMAIN][DATA_MANAGER]
+
+    return {
+        "entry": dict(entry.data),
+        "options": dict(entry.options),
+        "connected": protocol.available,
+        "circuit_open": protocol.circuit_open,
+        "last_update_success": coordinator.last_update_success,
+        "stale_since": coordinator.stale_since,
+        "data": coordinator.data.as_dict(),
+        "poll_intervals": coordinator.poll_intervals,
+        "stats": protocol.stats.as_dict(),
+        "startup_timing": manager.startup_timing(entry.entry_id),
+        "fleet": manager.health,
+    }
@@ -0,0 +1,96 @@
+"""Network discovery of Dolby CP750 processors."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+from typing import Final
+
+from .parser import DATA_KEYS, POLL_COMMANDS, parse_response
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hosts probed at the same time while scanning a subnet
+DISCOVERY_CONCURRENCY: Final = 64
+
+# Seconds to wait for a host to accept the connection and to answer
+DISCOVERY_TIMEOUT: Final = 1.0
+
+# Largest subnet a scan accepts (a /22, 1022 hosts)
+MAX_DISCOVERY_HOSTS: Final = 1024
+
+_HANDSHAKE_KEY: Final = "fader"
+
+
+async def async_probe(host: str, port: int, timeout: float = DISCOVERY_TIMEOUT) -> bool:
+    """Return True if host answers the CP750 handshake on port.
+
+    The handshake queries the fader and checks that the reply echoes the
+    fader key with a valid level, so any other service listening on the
+    port is rejected.
+    """
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port), timeout=timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    key = DATA_KEYS[_HANDSHAKE_KEY]
+    try:
+        writer.write(f"{POLL_COMMANDS[_HANDSHAKE_KEY]}\r\n".encode())
+        async with asyncio.timeout(timeout):
+            await writer.drain()
+            while line := await reader.readline():
+                response = line.decode(errors="replace").strip()
+                # Skip unsolicited messages sent before the reply
+                if response.split(" ", 1)[0] != key:
+                    continue
+                parse_response(_HANDSHAKE_KEY, response)
+                return True
+    except (OSError, asyncio.TimeoutError, ValueError) as err:
+        _LOGGER.debug("Handshake with %s:%s failed: %s", host, port, err)
+    finally:
+        writer.close()
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+
+    return False
+
+
+def subnet_hosts(subnet: str) -> list[str]:
+    """Return the host addresses of a subnet such as 192.168.1.0/24.
+
+    Raises ValueError for malformed subnets and for subnets larger than
+    MAX_DISCOVERY_HOSTS.
+    """
+    network = ipaddress.ip_network(subnet, strict=False)
+    if network.num_addresses > MAX_DISCOVERY_HOSTS:
+        raise ValueError(f"Subnet {network} is too large to scan")
+
+    return [str(address) for address in network.hosts()]
+
+
+async def async_discover(
+    subnet: str,
+    port: int,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[str]:
+    """Scan a subnet and return the hosts that answer as a CP750.
+
+    At most `concurrency` hosts are probed at once, so a /24 takes a few
+    timeouts in total rather than one per address.
+    """
+    hosts = subnet_hosts(subnet)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def probe(host: str) -> bool:
+        async with semaphore:
+            return await async_probe(host, port, timeout)
+
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    found = [host for host, ok in zip(hosts, results) if ok]
+    _LOGGER.debug("Found %d CP750 processor(s) in %s: %s", len(found), subnet, found)
+    return found
@@ -0,0 +1,95 @@
+"""Base entity for Dolby CP750."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import DolbyCP750Coordinator
+from .registry import CP750Key
+
+
+class DolbyCP750Entity(CoordinatorEntity[DolbyCP750Coordinator]):
+    """Coordinator entity that only writes state when its own data changes.
+
+    Subclasses list the coordinator data keys they render in _data_keys.
+    A coordinator update that changed none of them, and didn't change
+    availability or staleness, writes no state.
+
+    Values restored from the last run stay available, flagged with a
+    stale_since attribute, until the device confirms them.
+    """
+
+    _data_keys: tuple[str, ...] = ()
+    # Only meaningful live, not worth a row per state in the recorder
+    _unrecorded_attributes = frozenset({"stale_since"})
+    _last_available: bool | None = None
+    _last_stale: bool | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True if the data is live or restored from the last run."""
+        return super().available or self.coordinator.stale
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from the last run."""
+        if self.coordinator.stale_since is None or not self._data_keys:
+            return None
+        return {"stale_since": self.coordinator.stale_since.isoformat()}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability, staleness or a subscribed key changed."""
+        available = self.available
+        stale = self.coordinator.stale
+        if (
+            available == self._last_available
+            and stale == self._last_stale
+            and self.coordinator.changed_keys.isdisjoint(self._data_keys)
+        ):
+            return
+
+        self._last_available = available
+        self._last_stale = stale
+        self.async_write_ha_state()
+
+
+class DolbyCP750KeyEntity(DolbyCP750Entity):
+    """Entity generated from a key of the registry."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: DolbyCP750Coordinator,
+        name: str,
+        unique_id: str,
+        key: CP750Key,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._key = key
+        self._data_keys = (key.data_key,)
+        self._attr_name = key.name
+        self._attr_unique_id = f"{unique_id}_{key.data_key}"
+        self._attr_device_class = key.device_class
+        self._attr_entity_category = key.entity_category
+        self._attr_entity_registry_enabled_default = key.enabled_default
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, unique_id)},
+            name=name,
+            manufacturer="Dolby",
+            model="CP750",
+        )
+
+    @property
+    def _value(self) -> Any:
+        """Return the current value of the key."""
+        if self.coordinator.data:
+            return self.coordinator.data.get(self._key.data_key)
+        return None
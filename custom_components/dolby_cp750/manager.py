@@ -0,0 +1,186 @@
+"""Connection manager shared by every Dolby CP750 config entry."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+import logging
+from typing import Any, Final
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, DolbyCP750Protocol
+from .coordinator import MIN_POLL_INTERVAL, DolbyCP750Coordinator
+from .profiles import PROFILES, PollProfile, Profile
+from .schedule import DolbyCP750Schedule
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of processors polled at the same time
+MAX_CONCURRENT_POLLS: Final = 4
+
+# Maximum number of processors connected at the same time during startup
+MAX_CONCURRENT_CONNECTS: Final = 8
+
+
+class DolbyCP750Manager:
+    """Own every processor connection and drive their polls.
+
+    A single timer ticks for the whole domain. Each tick spreads the device
+    polls evenly across the interval, so a fleet of processors never fires
+    all at once, and a semaphore caps how many polls run concurrently.
+
+    Adding a processor never blocks setup: its first connection and refresh
+    run in a background warm-up, a few processors at a time, and the time
+    each step took is kept for diagnostics.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        self._coordinators: dict[str, DolbyCP750Coordinator] = {}
+        # Entry id -> poll task running for it
+        self._polling: dict[str, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
+        self._connect_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)
+        self._warm_ups: dict[str, asyncio.Task] = {}
+        self._startup_timing: dict[str, dict[str, Any]] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_device(
+        self,
+        entry_id: str,
+        host: str,
+        port: int,
+        name: str,
+        power_switch: str | None = None,
+        profile: PollProfile = PROFILES[Profile.STANDARD],
+        show_schedule: DolbyCP750Schedule | None = None,
+    ) -> DolbyCP750Coordinator:
+        """Create the connection and coordinator for a processor."""
+        protocol = DolbyCP750Protocol(self.hass, host, port, power_switch)
+        protocol.async_start()
+        coordinator = DolbyCP750Coordinator(
+            self.hass, protocol, name, entry_id, profile, show_schedule
+        )
+        self._coordinators[entry_id] = coordinator
+        self._warm_ups[entry_id] = self.hass.async_create_background_task(
+            self._async_warm_up(entry_id, coordinator),
+            f"{DOMAIN} warm-up {host}",
+        )
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_interval(
+                self.hass, self._async_tick, MIN_POLL_INTERVAL
+            )
+
+        return coordinator
+
+    async def async_remove_device(self, entry_id: str) -> None:
+        """Close a processor connection and stop polling it."""
+        coordinator = self._coordinators.pop(entry_id)
+        # Nothing may still be talking to the processor while it is closed
+        tasks = [
+            task
+            for task in (
+                self._warm_ups.pop(entry_id, None),
+                self._polling.pop(entry_id, None),
+            )
+            if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._startup_timing.pop(entry_id, None)
+        await coordinator.async_shutdown()
+
+        if not self._coordinators and self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if no processor is managed."""
+        return not self._coordinators
+
+    @property
+    def health(self) -> dict[str, Any]:
+        """Return aggregate health of the fleet."""
+        coordinators = self._coordinators.values()
+        return {
+            "devices": len(self._coordinators),
+            "connected": sum(1 for c in coordinators if c.protocol.available),
+            "failing": sum(1 for c in coordinators if not c.last_update_success),
+            "polls_in_flight": len(self._polling),
+            "warming_up": len(self._warm_ups),
+        }
+
+    def startup_timing(self, entry_id: str) -> dict[str, Any] | None:
+        """Return how long each startup step of a processor took, in seconds."""
+        return self._startup_timing.get(entry_id)
+
+    async def _async_warm_up(
+        self, entry_id: str, coordinator: DolbyCP750Coordinator
+    ) -> None:
+        """Connect to a new processor and fetch its state in the background."""
+        protocol = coordinator.protocol
+        loop = self.hass.loop
+        timing: dict[str, Any] = {}
+        self._startup_timing[entry_id] = timing
+        started = loop.time()
+
+        try:
+            async with self._connect_semaphore:
+                timing["queued"] = round(loop.time() - started, 3)
+                connecting = loop.time()
+                try:
+                    await protocol.connect()
+                except ConnectionError as err:
+                    _LOGGER.debug("%s not reachable at startup: %s", protocol.host, err)
+                timing["connect"] = round(loop.time() - connecting, 3)
+
+            refreshing = loop.time()
+            async with self._semaphore:
+                await coordinator.async_refresh()
+            timing["first_refresh"] = round(loop.time() - refreshing, 3)
+            timing["total"] = round(loop.time() - started, 3)
+            timing["connected"] = protocol.available
+
+            _LOGGER.debug(
+                "%s started in %.2fs (queued %.2fs, connect %.2fs, first refresh %.2fs)",
+                protocol.host, timing["total"], timing["queued"],
+                timing["connect"], timing["first_refresh"],
+            )
+        finally:
+            if self._warm_ups.get(entry_id) is asyncio.current_task():
+                del self._warm_ups[entry_id]
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Schedule one staggered poll per processor."""
+        step = MIN_POLL_INTERVAL.total_seconds() / max(len(self._coordinators), 1)
+
+        for index, (entry_id, coordinator) in enumerate(self._coordinators.items()):
+            # A slow processor skips ticks instead of piling up polls, and
+            # one still warming up is polled by its warm-up
+            if entry_id in self._polling or entry_id in self._warm_ups:
+                continue
+
+            self._polling[entry_id] = self.hass.async_create_background_task(
+                self._async_poll(entry_id, coordinator, index * step),
+                f"{DOMAIN} poll {coordinator.protocol.host}",
+            )
+
+    async def _async_poll(
+        self, entry_id: str, coordinator: DolbyCP750Coordinator, delay: float
+    ) -> None:
+        """Poll one processor at its slot within the tick."""
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            async with self._semaphore:
+                await coordinator.async_refresh()
+        finally:
+            if self._polling.get(entry_id) is asyncio.current_task():
+                del self._polling[entry_id]
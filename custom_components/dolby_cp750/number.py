@@ -1,16 +1,30 @@
 """Fader control for Dolby CP750."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 
+import voluptuous as vol
+
 from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import (
+    ATTR_CURVE,
+    ATTR_DURATION,
+    ATTR_LEVEL,
+    DOMAIN,
+    FADE_CURVES,
+    FADE_RENDER_INTERVAL,
+    SERVICE_FADE_TO,
+    SERVICE_STOP_FADE,
+)
+from .entity import DolbyCP750Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,14 +46,28 @@ async def async_setup_entry(
     
     async_add_entities([entity])
 
-class DolbyCP750Fader(CoordinatorEntity, NumberEntity):
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_FADE_TO,
+        {
+            vol.Required(ATTR_LEVEL): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+            vol.Required(ATTR_DURATION): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+            vol.Optional(ATTR_CURVE, default="linear"): vol.In(list(FADE_CURVES)),
+        },
+        "async_fade_to",
+    )
+    platform.async_register_entity_service(SERVICE_STOP_FADE, {}, "async_stop_fade")
+
+class DolbyCP750Fader(DolbyCP750Entity, NumberEntity):
     """Fader control for Dolby CP750."""
 
     _attr_has_entity_name = True
+    _data_keys = ("fader",)
     _attr_native_min_value = 0
     _attr_native_max_value = 100
     _attr_native_step = 1
     _attr_mode = NumberMode.SLIDER
+    _unsub_render: CALLBACK_TYPE | None = None
 
     def __init__(
         self, 
@@ -67,12 +95,63 @@ class DolbyCP750Fader(CoordinatorEntity, NumberEntity):
             return self.coordinator.data.get("fader")
         return None
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write fade steps at most once per FADE_RENDER_INTERVAL."""
+        coordinator = self.coordinator
+        if (
+            coordinator.fading
+            and "fader" in coordinator.changed_keys
+            and self._unsub_render is None
+        ):
+            self._unsub_render = async_call_later(
+                self.hass, FADE_RENDER_INTERVAL, self._async_render
+            )
+
+        if self._unsub_render is not None:
+            if coordinator.fading:
+                # The pending write covers this update
+                return
+            # The fade is over, write where it ended right away
+            self._async_cancel_render()
+            self.async_write_ha_state()
+            return
+
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_render(self, _now: datetime) -> None:
+        """Write the level the fade has reached."""
+        self._unsub_render = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_render(self) -> None:
+        """Drop a pending fade step write."""
+        if self._unsub_render is not None:
+            self._unsub_render()
+            self._unsub_render = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the fade step timer when the entity is removed."""
+        self._async_cancel_render()
+        await super().async_will_remove_from_hass()
+
     async def async_set_native_value(self, value: float) -> None:
         """Set the fader level."""
+        self.coordinator.async_stop_fade()
         try:
             # Assicuriamoci che il valore sia un intero nel range corretto
             int_value = round(max(0, min(100, value)))
-            await self.coordinator.protocol.send_command(f"cp750.sys.fader {int_value}")
-            await self.coordinator.async_request_refresh()
+            # Slider drags send many values, only the latest one goes out
+            await self.coordinator.async_write_coalesced("fader", float(int_value), str(int_value))
         except Exception as err:
-            _LOGGER.error("Failed to set fader: %s", err)
\ No newline at end of file
+            _LOGGER.error("Failed to set fader: %s", err)
+
+    async def async_fade_to(self, level: float, duration: float, curve: str = "linear") -> None:
+        """Fade the fader to a level over a duration."""
+        await self.coordinator.async_fade_fader(level, duration, curve)
+
+    async def async_stop_fade(self) -> None:
+        """Stop a running fade."""
+        self.coordinator.async_stop_fade()
@@ -0,0 +1,54 @@
+"""Response parser for the Dolby CP750 line protocol."""
+from __future__ import annotations
+
+from typing import Any, Callable, Final
+
+from .const import encode_command
+from .registry import KEYS
+
+
+# Protocol key -> (data key, value parser)
+RESPONSE_TYPES: Final[dict[str, tuple[str, Callable[[str], Any]]]] = {
+    key.key: (key.data_key, key.parser) for key in KEYS
+}
+
+# Data key -> protocol key
+DATA_KEYS: Final = {data_key: key for key, (data_key, _) in RESPONSE_TYPES.items()}
+
+# Data key -> query command
+POLL_COMMANDS: Final = {data_key: f"{key} ?" for data_key, key in DATA_KEYS.items()}
+
+# Data key -> pre-encoded query, see DolbyCP750Protocol.send_prepared
+QUERIES: Final = {data_key: encode_command(command) for data_key, command in POLL_COMMANDS.items()}
+
+
+def parse_message(message: str) -> tuple[str, Any] | None:
+    """Parse any device message into a (data key, value) pair.
+
+    Returns None for keys the integration doesn't track and for malformed
+    values, so unsolicited traffic can be fed in as is.
+    """
+    key, _, value = message.partition(" ")
+    response_type = RESPONSE_TYPES.get(key)
+    if response_type is None:
+        return None
+
+    data_key, parser = response_type
+    try:
+        return data_key, parser(value)
+    except ValueError:
+        return None
+
+
+def parse_response(data_key: str, response: str) -> Any:
+    """Parse the reply to a query for data_key.
+
+    Raises ValueError if the echoed key doesn't match the query or the value
+    is malformed.
+    """
+    key, _, value = response.partition(" ")
+    expected = DATA_KEYS[data_key]
+    if key != expected:
+        raise ValueError(f"Expected reply for {expected}, got: {response}")
+
+    return RESPONSE_TYPES[key][1](value)
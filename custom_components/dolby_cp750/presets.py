@@ -0,0 +1,78 @@
+"""Named presets of several Dolby CP750 settings."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Final
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION
+from .state import DolbyCP750State
+
+_LOGGER = logging.getLogger(__name__)
+
+# Data keys a preset can set, in the order they are written. The input is
+# switched first and the mute released last, so a show start never plays
+# the old input at the new level.
+PRESET_KEYS: Final = ("input", "fader", "mute")
+
+# Data key -> raw value the device expects
+PRESET_ENCODERS: Final[dict[str, Callable[[Any], str]]] = {
+    "input": str,
+    "fader": lambda level: str(round(max(0, min(100, level)))),
+    "mute": lambda muted: "1" if muted else "0",
+}
+
+
+def preset_writes(values: dict[str, Any]) -> list[tuple[str, str]]:
+    """Return the (data key, raw value) writes of a preset, in write order."""
+    return [
+        (data_key, PRESET_ENCODERS[data_key](values[data_key]))
+        for data_key in PRESET_KEYS
+        if values.get(data_key) is not None
+    ]
+
+
+def preset_from_state(state: DolbyCP750State) -> dict[str, Any]:
+    """Return a preset capturing the current settings of a processor."""
+    return {
+        data_key: state.get(data_key)
+        for data_key in PRESET_KEYS
+        if state.get(data_key) is not None
+    }
+
+
+class DolbyCP750Presets:
+    """Named presets shared by every processor, persisted across restarts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the presets."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.presets"
+        )
+        self._presets: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the saved presets."""
+        self._presets = await self._store.async_load() or {}
+
+    def get(self, name: str) -> dict[str, Any] | None:
+        """Return the values of a preset."""
+        return self._presets.get(name)
+
+    @property
+    def names(self) -> list[str]:
+        """Return the name of every preset."""
+        return list(self._presets)
+
+    async def async_save(self, name: str, values: dict[str, Any]) -> None:
+        """Create or replace a preset."""
+        self._presets[name] = values
+        await self._store.async_save(self._presets)
+        _LOGGER.debug("Saved preset %s: %s", name, values)
+
+    async def async_delete(self, name: str) -> None:
+        """Delete a preset."""
+        if self._presets.pop(name, None) is not None:
+            await self._store.async_save(self._presets)
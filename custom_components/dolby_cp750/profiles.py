@@ -0,0 +1,92 @@
+"""Performance profiles of a Dolby CP750 connection."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import Any, Final
+
+from .const import RESPONSE_TIMEOUT
+from .registry import POLL_INTERVALS, PollClass
+
+# Config entry options
+CONF_PROFILE: Final = "profile"
+CONF_FAST_MIN_INTERVAL: Final = "fast_min_interval"
+CONF_FAST_MAX_INTERVAL: Final = "fast_max_interval"
+CONF_SLOW_MIN_INTERVAL: Final = "slow_min_interval"
+CONF_SLOW_MAX_INTERVAL: Final = "slow_max_interval"
+CONF_RESPONSE_TIMEOUT: Final = "response_timeout"
+
+
+class Profile(StrEnum):
+    """Named performance profile."""
+
+    STANDARD = "standard"
+    SHOW = "show"
+    IDLE = "idle"
+    CUSTOM = "custom"
+
+
+@dataclass(frozen=True)
+class PollProfile:
+    """Poll intervals and reply timeout applied to one processor."""
+
+    # Poll class -> (fastest, slowest) poll interval, see POLL_INTERVALS
+    intervals: Mapping[PollClass, tuple[timedelta, timedelta]]
+    response_timeout: float
+
+
+_STATIC = POLL_INTERVALS[PollClass.STATIC]
+
+PROFILES: Final[dict[Profile, PollProfile]] = {
+    # The defaults, for a booth with a decent network
+    Profile.STANDARD: PollProfile(POLL_INTERVALS, RESPONSE_TIMEOUT),
+    # During shows: follow changes closely and give up on replies quickly
+    Profile.SHOW: PollProfile(
+        {
+            PollClass.FAST: (timedelta(seconds=1), timedelta(seconds=5)),
+            PollClass.SLOW: (timedelta(seconds=5), timedelta(minutes=1)),
+            PollClass.STATIC: _STATIC,
+        },
+        1.0,
+    ),
+    # Dark screens and slow links: poll rarely and be patient
+    Profile.IDLE: PollProfile(
+        {
+            PollClass.FAST: (timedelta(seconds=5), timedelta(minutes=2)),
+            PollClass.SLOW: (timedelta(minutes=1), timedelta(minutes=30)),
+            PollClass.STATIC: _STATIC,
+        },
+        5.0,
+    ),
+}
+
+
+def profile_from_options(options: Mapping[str, Any]) -> PollProfile:
+    """Return the profile selected in a config entry's options."""
+    profile = Profile(options.get(CONF_PROFILE, Profile.STANDARD))
+    if profile is not Profile.CUSTOM:
+        return PROFILES[profile]
+
+    standard = PROFILES[Profile.STANDARD]
+
+    def interval(option: str, poll_class: PollClass, index: int) -> timedelta:
+        if option in options:
+            return timedelta(seconds=options[option])
+        return standard.intervals[poll_class][index]
+
+    return PollProfile(
+        {
+            PollClass.FAST: (
+                interval(CONF_FAST_MIN_INTERVAL, PollClass.FAST, 0),
+                interval(CONF_FAST_MAX_INTERVAL, PollClass.FAST, 1),
+            ),
+            PollClass.SLOW: (
+                interval(CONF_SLOW_MIN_INTERVAL, PollClass.SLOW, 0),
+                interval(CONF_SLOW_MAX_INTERVAL, PollClass.SLOW, 1),
+            ),
+            PollClass.STATIC: _STATIC,
+        },
+        options.get(CONF_RESPONSE_TIMEOUT, standard.response_timeout),
+    )
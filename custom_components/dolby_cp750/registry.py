@@ -0,0 +1,166 @@
+"""Typed registry of the Dolby CP750 keys the integration tracks.
+
+Every key is described once here. The parser, the poll scheduler and the
+generated entities are all derived from KEYS.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import StrEnum
+from typing import Any, Final
+
+from homeassistant.const import EntityCategory, Platform, UnitOfTime
+
+from .const import INPUT_SOURCES
+
+
+class PollClass(StrEnum):
+    """How often a key is expected to change."""
+
+    FAST = "fast"
+    SLOW = "slow"
+    STATIC = "static"
+
+
+# Poll class -> (fastest, slowest) poll interval. A key is polled at the
+# fastest rate right after it changes and backs off to the slowest while
+# it stays put.
+POLL_INTERVALS: Final = {
+    PollClass.FAST: (timedelta(seconds=1), timedelta(seconds=30)),
+    PollClass.SLOW: (timedelta(seconds=5), timedelta(minutes=5)),
+    PollClass.STATIC: (timedelta(hours=1), timedelta(hours=1)),
+}
+
+
+def _parse_level(value: str) -> float:
+    """Parse a fader level or other number."""
+    return float(value)
+
+
+def _parse_int(value: str) -> int:
+    """Parse an integer."""
+    return int(value)
+
+
+def _parse_input(value: str) -> str:
+    """Parse an input mode, rejecting unknown sources."""
+    if value not in INPUT_SOURCES:
+        raise ValueError(f"Unknown input mode: {value}")
+    return value
+
+
+def _parse_flag(value: str) -> bool:
+    """Parse a 0/1 flag."""
+    if value == "1":
+        return True
+    if value == "0":
+        return False
+    raise ValueError(f"Invalid flag: {value}")
+
+
+def _parse_text(value: str) -> str:
+    """Parse a free-form value."""
+    if not value:
+        raise ValueError("Empty value")
+    return value
+
+
+@dataclass(frozen=True)
+class CP750Key:
+    """A key of the CP750 line protocol."""
+
+    key: str
+    data_key: str
+    parser: Callable[[str], Any]
+    poll_class: PollClass
+    # Entity generated for the key, None for keys with a dedicated entity
+    platform: Platform | None = None
+    name: str | None = None
+    device_class: str | None = None
+    unit: str | None = None
+    entity_category: EntityCategory | None = None
+    enabled_default: bool = True
+    # Not confirmed against the CP750 protocol documentation: queried with a
+    # short timeout, and only now and then once the firmware ignored it
+    optional: bool = False
+
+
+KEYS: Final[tuple[CP750Key, ...]] = (
+    # Controls, rendered by the number, select and switch platforms
+    CP750Key("cp750.sys.fader", "fader", _parse_level, PollClass.FAST),
+    CP750Key("cp750.sys.input_mode", "input", _parse_input, PollClass.FAST),
+    CP750Key("cp750.sys.mute", "mute", _parse_flag, PollClass.FAST),
+    # Input signal state
+    *(
+        CP750Key(
+            f"cp750.state.dig_{i}_valid",
+            f"dig_{i}_valid",
+            _parse_flag,
+            PollClass.SLOW,
+            Platform.BINARY_SENSOR,
+            f"Digital {i} Valid",
+            device_class="connectivity",
+        )
+        for i in range(1, 5)
+    ),
+    CP750Key(
+        "cp750.state.format",
+        "format",
+        _parse_text,
+        PollClass.SLOW,
+        Platform.SENSOR,
+        "Input format",
+        enabled_default=False,
+        optional=True,
+    ),
+    CP750Key(
+        "cp750.state.decoder_mode",
+        "decoder_mode",
+        _parse_text,
+        PollClass.SLOW,
+        Platform.SENSOR,
+        "Decoder mode",
+        enabled_default=False,
+        optional=True,
+    ),
+    # Setup values, changed from the front panel or CP750 software only
+    CP750Key(
+        "cp750.sys.delay",
+        "delay",
+        _parse_int,
+        PollClass.STATIC,
+        Platform.SENSOR,
+        "Delay",
+        unit=UnitOfTime.MILLISECONDS,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        enabled_default=False,
+        optional=True,
+    ),
+    *(
+        CP750Key(
+            f"cp750.sys.{source}_fader_preset",
+            f"{source}_fader_preset",
+            _parse_level,
+            PollClass.STATIC,
+            Platform.SENSOR,
+            f"{label} fader preset",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            enabled_default=False,
+            optional=True,
+        )
+        for source, label in INPUT_SOURCES.items()
+    ),
+)
+
+# Data key -> key description
+KEYS_BY_DATA_KEY: Final = {key.data_key: key for key in KEYS}
+
+# Data keys the firmware may not answer, see CP750Key.optional
+OPTIONAL_KEYS: Final = frozenset(key.data_key for key in KEYS if key.optional)
+
+
+def keys_for_platform(platform: Platform) -> list[CP750Key]:
+    """Return the keys that get a generated entity on a platform."""
+    return [key for key in KEYS if key.platform == platform]
@@ -0,0 +1,167 @@
+"""Show schedule of a Dolby CP750, from time windows or a calendar."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime, time, timedelta
+import logging
+from typing import Any, Final
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Config entry options
+CONF_SHOW_CALENDAR: Final = "show_calendar"
+CONF_SHOW_WINDOWS: Final = "show_windows"
+CONF_PREWARM: Final = "prewarm"
+
+# Minutes before a show starts when polling speeds up and the connection
+# is opened
+DEFAULT_PREWARM: Final = 10
+
+# How often the windows are checked
+SCHEDULE_CHECK_INTERVAL: Final = timedelta(minutes=1)
+
+_MINUTES_PER_DAY: Final = 24 * 60
+
+
+def parse_show_windows(value: str) -> list[tuple[time, time]]:
+    """Parse windows such as "14:00-16:30, 19:30-00:30".
+
+    A window ending before it starts runs past midnight. Raises ValueError
+    for malformed windows.
+    """
+    windows = []
+    for window in filter(None, (part.strip() for part in value.split(","))):
+        start, sep, end = window.partition("-")
+        start_time = dt_util.parse_time(start.strip())
+        end_time = dt_util.parse_time(end.strip())
+        if not sep or start_time is None or end_time is None:
+            raise ValueError(f"Invalid show window: {window}")
+        windows.append((start_time, end_time))
+    return windows
+
+
+def _minutes(value: time) -> int:
+    """Return the minute of the day of a time."""
+    return value.hour * 60 + value.minute
+
+
+class DolbyCP750Schedule:
+    """Tell whether a processor is in a show, counting the pre-warm lead.
+
+    Shows come from fixed daily windows, from a calendar entity (on while
+    an event runs, with the next event's start in its attributes), or both.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        windows: list[tuple[time, time]],
+        calendar: str | None = None,
+        prewarm: timedelta = timedelta(minutes=DEFAULT_PREWARM),
+    ) -> None:
+        """Initialize the schedule."""
+        self.hass = hass
+        self._windows = [
+            (_minutes(start), _minutes(end)) for start, end in windows
+        ]
+        self._calendar = calendar
+        self._prewarm = prewarm
+        self._in_show: bool | None = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @property
+    def in_show(self) -> bool:
+        """Return True during a show or its pre-warm lead."""
+        if self._in_show is None:
+            self._in_show = self._async_evaluate()
+        return self._in_show
+
+    @callback
+    def async_start(self, update_callback: Callable[[bool], None]) -> None:
+        """Call update_callback whenever a show starts or ends."""
+
+        @callback
+        def _async_check(*_: Any) -> None:
+            in_show = self._async_evaluate()
+            if in_show == self._in_show:
+                return
+            self._in_show = in_show
+            update_callback(in_show)
+
+        self._unsubs.append(
+            async_track_time_interval(self.hass, _async_check, SCHEDULE_CHECK_INTERVAL)
+        )
+        if self._calendar:
+            self._unsubs.append(
+                async_track_state_change_event(self.hass, [self._calendar], _async_check)
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the schedule."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    @callback
+    def _async_evaluate(self) -> bool:
+        """Return True if now is within a show or its pre-warm lead."""
+        now = dt_util.now()
+        return self._in_window(now) or self._in_calendar_event(now)
+
+    def _in_window(self, now: datetime) -> bool:
+        """Return True if now is within a daily window."""
+        minute = now.hour * 60 + now.minute
+        lead = int(self._prewarm.total_seconds() // 60)
+        for start, end in self._windows:
+            start = (start - lead) % _MINUTES_PER_DAY
+            if start <= end:
+                if start <= minute < end:
+                    return True
+            elif minute >= start or minute < end:
+                return True
+        return False
+
+    def _in_calendar_event(self, now: datetime) -> bool:
+        """Return True if the calendar has an event running or about to start."""
+        if not self._calendar:
+            return False
+        state = self.hass.states.get(self._calendar)
+        if state is None:
+            return False
+        if state.state == STATE_ON:
+            return True
+
+        # While off, the attributes describe the next event
+        start = state.attributes.get("start_time")
+        if not start:
+            return False
+        start_time = dt_util.parse_datetime(start)
+        if start_time is None:
+            return False
+        start_time = dt_util.as_local(start_time)
+        return now <= start_time <= now + self._prewarm
+
+
+def schedule_from_options(
+    hass: HomeAssistant, options: Mapping[str, Any]
+) -> DolbyCP750Schedule | None:
+    """Return the show schedule set in a config entry's options, if any."""
+    calendar = options.get(CONF_SHOW_CALENDAR)
+    windows = parse_show_windows(options.get(CONF_SHOW_WINDOWS, ""))
+    if not calendar and not windows:
+        return None
+
+    return DolbyCP750Schedule(
+        hass,
+        windows,
+        calendar,
+        timedelta(minutes=options.get(CONF_PREWARM, DEFAULT_PREWARM)),
+    )
@@ -7,13 +7,13 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     DOMAIN,
     INPUT_SOURCES,
 )
+from .entity import DolbyCP750Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,10 +35,11 @@ async def async_setup_entry(
     
     async_add_entities([entity])
 
-class DolbyCP750InputSelect(CoordinatorEntity, SelectEntity):
+class DolbyCP750InputSelect(DolbyCP750Entity, SelectEntity):
     """Input selector for Dolby CP750."""
 
     _attr_has_entity_name = True
+    _data_keys = ("input",)
 
     def __init__(
         self, 
@@ -74,8 +75,7 @@ class DolbyCP750InputSelect(CoordinatorEntity, SelectEntity):
         for key, value in INPUT_SOURCES.items():
             if value == option:
                 try:
-                    await self.coordinator.protocol.send_command(f"cp750.sys.input_mode {key}")
-                    await self.coordinator.async_request_refresh()
+                    await self.coordinator.async_send_command(f"cp750.sys.input_mode {key}")
                 except Exception as err:
                     _LOGGER.error("Failed to set input: %s", err)
                 break
\ No newline at end of file
@@ -0,0 +1,172 @@
+"""Sensors for Dolby CP750."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import logging
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, Platform, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType
+
+from .const import DOMAIN
+from .coordinator import DolbyCP750Coordinator
+from .entity import DolbyCP750Entity, DolbyCP750KeyEntity
+from .registry import CP750Key, keys_for_platform
+from .stats import DolbyCP750Stats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DolbyCP750SensorEntityDescription(SensorEntityDescription):
+    """Describes a Dolby CP750 diagnostic sensor."""
+
+    value_fn: Callable[[DolbyCP750Stats], float | int | None]
+
+
+SENSORS: tuple[DolbyCP750SensorEntityDescription, ...] = (
+    DolbyCP750SensorEntityDescription(
+        key="rtt_p50",
+        name="Response time p50",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.rtt_percentile_ms(50),
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="rtt_p95",
+        name="Response time p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.rtt_percentile_ms(95),
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.reconnects,
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="timeouts",
+        name="Timeouts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.timeouts,
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="errors",
+        name="Command errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.errors,
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="bytes_sent",
+        name="Bytes sent",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.bytes_sent,
+    ),
+    DolbyCP750SensorEntityDescription(
+        key="bytes_received",
+        name="Bytes received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        value_fn=lambda stats: stats.bytes_received,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Dolby CP750 sensors."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
+    name = hass.data[DOMAIN][config_entry.entry_id]["name"]
+    unique_id = config_entry.unique_id or config_entry.entry_id
+
+    entities: list[SensorEntity] = [
+        DolbyCP750Sensor(coordinator, name, unique_id, key)
+        for key in keys_for_platform(Platform.SENSOR)
+    ]
+    entities.extend(
+        DolbyCP750DiagnosticSensor(coordinator, name, unique_id, description)
+        for description in SENSORS
+    )
+    async_add_entities(entities)
+
+
+class DolbyCP750Sensor(DolbyCP750KeyEntity, SensorEntity):
+    """Sensor for a CP750 value, such as the input format or delay."""
+
+    def __init__(
+        self,
+        coordinator: DolbyCP750Coordinator,
+        name: str,
+        unique_id: str,
+        key: CP750Key,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, name, unique_id, key)
+        self._attr_native_unit_of_measurement = key.unit
+
+    @property
+    def native_value(self) -> str | float | None:
+        """Return the current value."""
+        return self._value
+
+
+class DolbyCP750DiagnosticSensor(DolbyCP750Entity, SensorEntity):
+    """Connection statistic of a Dolby CP750."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    entity_description: DolbyCP750SensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: DolbyCP750Coordinator,
+        name: str,
+        unique_id: str,
+        description: DolbyCP750SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{unique_id}_{description.key}"
+
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, unique_id)},
+            name=name,
+            manufacturer="Dolby",
+            model="CP750",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Statistics stay meaningful while the device is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the current statistic."""
+        return self.entity_description.value_fn(self.coordinator.protocol.stats)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the statistic moved."""
+        value = self.native_value
+        if value == self._attr_native_value:
+            return
+
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,135 @@
+"""Domain services for Dolby CP750."""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import (
+    ATTR_FADER,
+    ATTR_INPUT,
+    ATTR_MUTE,
+    ATTR_PRESET,
+    DATA_PRESETS,
+    DOMAIN,
+    INPUT_SOURCES,
+    SERVICE_APPLY_PRESET,
+    SERVICE_DELETE_PRESET,
+    SERVICE_SAVE_PRESET,
+)
+from .coordinator import DolbyCP750Coordinator
+from .presets import DolbyCP750Presets, preset_from_state, preset_writes
+
+_LOGGER = logging.getLogger(__name__)
+
+PRESET_VALUE_FIELDS = {
+    vol.Optional(ATTR_INPUT): vol.In(list(INPUT_SOURCES)),
+    vol.Optional(ATTR_FADER): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+    vol.Optional(ATTR_MUTE): cv.boolean,
+}
+
+APPLY_PRESET_SCHEMA = cv.make_entity_service_schema(
+    {vol.Optional(ATTR_PRESET): cv.string, **PRESET_VALUE_FIELDS}
+)
+SAVE_PRESET_SCHEMA = cv.make_entity_service_schema(
+    {vol.Required(ATTR_PRESET): cv.string, **PRESET_VALUE_FIELDS}
+)
+DELETE_PRESET_SCHEMA = vol.Schema({vol.Required(ATTR_PRESET): cv.string})
+
+
+async def _async_target_coordinators(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[DolbyCP750Coordinator]:
+    """Return the coordinators of the processors a call targets."""
+    entry_ids = await async_extract_config_entry_ids(hass, call)
+    return [
+        hass.data[DOMAIN][entry_id]["coordinator"]
+        for entry_id in entry_ids
+        if entry_id in hass.data[DOMAIN]
+    ]
+
+
+def _call_values(call: ServiceCall) -> dict:
+    """Return the preset values given in a call."""
+    return {
+        data_key: call.data[data_key]
+        for data_key in (ATTR_INPUT, ATTR_FADER, ATTR_MUTE)
+        if data_key in call.data
+    }
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Load the presets and register the preset services."""
+    presets = DolbyCP750Presets(hass)
+    await presets.async_load()
+    hass.data[DOMAIN][DATA_PRESETS] = presets
+
+    async def async_apply_preset(call: ServiceCall) -> None:
+        """Apply a stored preset and/or explicit values to every target."""
+        values = {}
+        if ATTR_PRESET in call.data:
+            stored = presets.get(call.data[ATTR_PRESET])
+            if stored is None:
+                raise HomeAssistantError(f"Unknown preset: {call.data[ATTR_PRESET]}")
+            values.update(stored)
+        # Values given in the call override the stored ones
+        values.update(_call_values(call))
+
+        writes = preset_writes(values)
+        if not writes:
+            raise HomeAssistantError("Nothing to apply")
+
+        coordinators = await _async_target_coordinators(hass, call)
+        # Every screen gets its burst at the same time
+        results = await asyncio.gather(
+            *(coordinator.async_write_burst(writes) for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        failed = []
+        for coordinator, result in zip(coordinators, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Failed to apply preset to %s: %s", coordinator.protocol.host, result
+                )
+                failed.append(coordinator.protocol.host)
+        if failed:
+            raise HomeAssistantError(f"Failed to apply preset to {', '.join(failed)}")
+
+    async def async_save_preset(call: ServiceCall) -> None:
+        """Save the given values, or the current settings of the target."""
+        values = _call_values(call)
+        if not values:
+            coordinators = await _async_target_coordinators(hass, call)
+            if len(coordinators) != 1:
+                raise HomeAssistantError(
+                    "Target exactly one processor to save its current settings"
+                )
+            values = preset_from_state(coordinators[0].data)
+        await presets.async_save(call.data[ATTR_PRESET], values)
+
+    async def async_delete_preset(call: ServiceCall) -> None:
+        """Delete a stored preset."""
+        await presets.async_delete(call.data[ATTR_PRESET])
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_APPLY_PRESET, async_apply_preset, schema=APPLY_PRESET_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SAVE_PRESET, async_save_preset, schema=SAVE_PRESET_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_DELETE_PRESET, async_delete_preset, schema=DELETE_PRESET_SCHEMA
+    )
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the preset services."""
+    for service in (SERVICE_APPLY_PRESET, SERVICE_SAVE_PRESET, SERVICE_DELETE_PRESET):
+        hass.services.async_remove(DOMAIN, service)
+    hass.data[DOMAIN].pop(DATA_PRESETS, None)
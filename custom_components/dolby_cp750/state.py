@@ -0,0 +1,56 @@
+"""In-place state of a Dolby CP750."""
+from __future__ import annotations
+
+from typing import Any
+
+from .registry import KEYS_BY_DATA_KEY
+
+
+class DolbyCP750State:
+    """Latest value of every registry key, updated in place.
+
+    One slot per data key keeps the object small and lets every poll update
+    it without building a new dict. Entities read it like a dict with get().
+    """
+
+    __slots__ = tuple(KEYS_BY_DATA_KEY)
+
+    def __init__(self) -> None:
+        """Initialize every value as unknown."""
+        for data_key in self.__slots__:
+            setattr(self, data_key, None)
+
+    def __getitem__(self, data_key: str) -> Any:
+        """Return the value of a key."""
+        try:
+            return getattr(self, data_key)
+        except AttributeError:
+            raise KeyError(data_key) from None
+
+    def get(self, data_key: str, default: Any = None) -> Any:
+        """Return the value of a key."""
+        value = getattr(self, data_key, None)
+        return default if value is None else value
+
+    def set(self, data_key: str, value: Any) -> bool:
+        """Store a value, returning True if it changed."""
+        if getattr(self, data_key) == value:
+            return False
+        setattr(self, data_key, value)
+        return True
+
+    def restore(self, values: dict[str, Any]) -> list[str]:
+        """Load saved values, returning the keys that were restored.
+
+        Keys no longer in the registry are ignored.
+        """
+        restored = []
+        for data_key, value in values.items():
+            if data_key in self.__slots__ and value is not None:
+                setattr(self, data_key, value)
+                restored.append(data_key)
+        return restored
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a copy of every value."""
+        return {data_key: getattr(self, data_key) for data_key in self.__slots__}
@@ -0,0 +1,229 @@
+"""Long-term statistics of fader, input and mute usage."""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+from typing import Final
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, INPUT_SOURCES
+from .coordinator import DolbyCP750Coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+_SECONDS_PER_HOUR: Final = 3600
+
+
+class DolbyCP750Statistics:
+    """Roll fader, input and mute changes up into hourly statistics.
+
+    Changes are folded into an in-memory buffer as they come in, and once
+    an hour the buffer is published as external statistics: the fader's
+    time-weighted mean, min and max, and the hours spent on each input and
+    muted. Nothing is written between the hourly rollups.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DolbyCP750Coordinator,
+        entry_id: str,
+        name: str,
+    ) -> None:
+        """Initialize the statistics."""
+        self.hass = hass
+        self._coordinator = coordinator
+        self._name = name
+        self._prefix = f"{DOMAIN}:{entry_id.lower()}"
+        # Current values and when they were last folded into the buffer
+        self._fader: float | None = None
+        self._input: str | None = None
+        self._mute: bool | None = None
+        self._since = dt_util.utcnow()
+        self._reset_buffer()
+        # Statistic id -> cumulative hours, continued from the recorder
+        self._sums: dict[str, float] = {}
+        self._load_task: asyncio.Task | None = None
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @property
+    def fader_id(self) -> str:
+        """Return the statistic id of the fader level."""
+        return f"{self._prefix}_fader"
+
+    @property
+    def mute_id(self) -> str:
+        """Return the statistic id of the time spent muted."""
+        return f"{self._prefix}_mute_time"
+
+    def input_id(self, source: str) -> str:
+        """Return the statistic id of the time spent on an input."""
+        return f"{self._prefix}_input_{source}_time"
+
+    def _reset_buffer(self) -> None:
+        """Start a new hour."""
+        self._fader_weighted = 0.0
+        self._fader_seconds = 0.0
+        self._fader_min = self._fader
+        self._fader_max = self._fader
+        self._input_seconds: dict[str, float] = {}
+        self._mute_seconds = 0.0
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the processor."""
+        self._async_record()
+        self._unsubs.append(self._coordinator.async_add_listener(self._async_record))
+        self._unsubs.append(
+            async_track_utc_time_change(self.hass, self._async_flush, minute=0, second=0)
+        )
+        # The sums are only needed at the first rollup, don't hold up setup
+        self._load_task = self.hass.async_create_background_task(
+            self._async_load_sums(), f"{DOMAIN} {self._name} statistics"
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the processor."""
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+        while self._unsubs:
+            self._unsubs.pop()()
+
+    async def _async_load_sums(self) -> None:
+        """Continue the running sums from the last published hour."""
+        statistic_ids = [self.mute_id, *(self.input_id(source) for source in INPUT_SOURCES)]
+        for statistic_id in statistic_ids:
+            last = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics, self.hass, 1, statistic_id, True, {"sum"}
+            )
+            rows = last.get(statistic_id)
+            # A sum published since setup already continues the old one
+            self._sums.setdefault(
+                statistic_id, (rows[0].get("sum") or 0.0) if rows else 0.0
+            )
+        self._load_task = None
+
+    @callback
+    def _async_fold(self, until: datetime) -> None:
+        """Add the time since the last fold to the buffer."""
+        elapsed = (until - self._since).total_seconds()
+        self._since = until
+        if elapsed <= 0:
+            return
+
+        if self._fader is not None:
+            self._fader_weighted += self._fader * elapsed
+            self._fader_seconds += elapsed
+        if self._input is not None:
+            self._input_seconds[self._input] = (
+                self._input_seconds.get(self._input, 0.0) + elapsed
+            )
+        if self._mute:
+            self._mute_seconds += elapsed
+
+    @callback
+    def _async_record(self) -> None:
+        """Fold in a change of the tracked values."""
+        coordinator = self._coordinator
+        # Time without live data counts towards nothing
+        live = coordinator.last_update_success and not coordinator.stale
+        data = coordinator.data
+        fader = data.get("fader") if live else None
+        input_key = data.get("input") if live else None
+        mute = data.get("mute") if live else None
+        if fader == self._fader and input_key == self._input and mute == self._mute:
+            return
+
+        self._async_fold(dt_util.utcnow())
+        self._fader, self._input, self._mute = fader, input_key, mute
+
+        if fader is not None:
+            if self._fader_min is None or fader < self._fader_min:
+                self._fader_min = fader
+            if self._fader_max is None or fader > self._fader_max:
+                self._fader_max = fader
+
+    @callback
+    def _async_flush(self, now: datetime) -> None:
+        """Publish the rollup of the hour that just ended."""
+        end = now.replace(minute=0, second=0, microsecond=0)
+        start = end - timedelta(hours=1)
+        self._async_fold(end)
+
+        if self._fader_seconds:
+            self._async_add(
+                self.fader_id,
+                f"{self._name} fader",
+                None,
+                StatisticData(
+                    start=start,
+                    mean=self._fader_weighted / self._fader_seconds,
+                    min=self._fader_min,
+                    max=self._fader_max,
+                ),
+                has_mean=True,
+                has_sum=False,
+            )
+
+        for source, seconds in self._input_seconds.items():
+            if source in INPUT_SOURCES:
+                self._async_add_time(
+                    self.input_id(source),
+                    f"{self._name} time on {INPUT_SOURCES[source]}",
+                    start,
+                    seconds,
+                )
+        if self._mute_seconds:
+            self._async_add_time(self.mute_id, f"{self._name} mute time", start, self._mute_seconds)
+
+        self._reset_buffer()
+
+    @callback
+    def _async_add_time(
+        self, statistic_id: str, name: str, start: datetime, seconds: float
+    ) -> None:
+        """Publish the hours spent in a state during one hour."""
+        hours = seconds / _SECONDS_PER_HOUR
+        self._sums[statistic_id] = self._sums.get(statistic_id, 0.0) + hours
+        self._async_add(
+            statistic_id,
+            name,
+            UnitOfTime.HOURS,
+            StatisticData(start=start, state=hours, sum=self._sums[statistic_id]),
+            has_mean=False,
+            has_sum=True,
+        )
+
+    @callback
+    def _async_add(
+        self,
+        statistic_id: str,
+        name: str,
+        unit: str | None,
+        data: StatisticData,
+        has_mean: bool,
+        has_sum: bool,
+    ) -> None:
+        """Publish one hourly statistic."""
+        metadata = StatisticMetaData(
+            has_mean=has_mean,
+            has_sum=has_sum,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=unit,
+        )
+        async_add_external_statistics(self.hass, metadata, [data])
@@ -0,0 +1,85 @@
+"""Connection statistics for Dolby CP750."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Final
+
+# Upper bounds of the round trip time histogram buckets, in milliseconds.
+# The last bucket catches everything slower.
+RTT_BUCKETS_MS: Final = (5, 10, 25, 50, 100, 250, 500, 1000, 2000)
+
+
+class DolbyCP750Stats:
+    """Counters and round trip time histogram for one processor."""
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.retries = 0
+        self.connects = 0
+        self.connect_failures = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.last_rtt_ms: float | None = None
+        self.rtt_histogram = [0] * (len(RTT_BUCKETS_MS) + 1)
+        self._rtt_total_ms = 0.0
+
+    @property
+    def reconnects(self) -> int:
+        """Return how many times the session was re-established."""
+        return max(self.connects - 1, 0)
+
+    def record_rtt(self, seconds: float) -> None:
+        """Record the round trip time of a successful request."""
+        rtt_ms = seconds * 1000
+        self.requests += 1
+        self.last_rtt_ms = rtt_ms
+        self._rtt_total_ms += rtt_ms
+        self.rtt_histogram[bisect_left(RTT_BUCKETS_MS, rtt_ms)] += 1
+
+    @property
+    def rtt_mean_ms(self) -> float | None:
+        """Return the mean round trip time."""
+        if not self.requests:
+            return None
+        return self._rtt_total_ms / self.requests
+
+    def rtt_percentile_ms(self, percentile: float) -> float | None:
+        """Estimate a round trip time percentile from the histogram.
+
+        Returns the upper bound of the bucket holding the percentile, or the
+        largest bound if it falls in the overflow bucket.
+        """
+        if not self.requests:
+            return None
+
+        threshold = self.requests * percentile / 100
+        seen = 0
+        for index, count in enumerate(self.rtt_histogram):
+            seen += count
+            if seen >= threshold:
+                return float(RTT_BUCKETS_MS[min(index, len(RTT_BUCKETS_MS) - 1)])
+        return float(RTT_BUCKETS_MS[-1])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "retries": self.retries,
+            "reconnects": self.reconnects,
+            "connect_failures": self.connect_failures,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "rtt_last_ms": self.last_rtt_ms,
+            "rtt_mean_ms": self.rtt_mean_ms,
+            "rtt_p50_ms": self.rtt_percentile_ms(50),
+            "rtt_p95_ms": self.rtt_percentile_ms(95),
+            "rtt_histogram_ms": {
+                **{f"<={bound}": count for bound, count in zip(RTT_BUCKETS_MS, self.rtt_histogram)},
+                f">{RTT_BUCKETS_MS[-1]}": self.rtt_histogram[-1],
+            },
+        }
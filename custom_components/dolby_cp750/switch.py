@@ -4,14 +4,15 @@ from __future__ import annotations
 import logging
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.const import STATE_ON
 
 from .const import DOMAIN
+from .entity import DolbyCP750Entity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,10 +49,11 @@ async def async_setup_entry(
     
     async_add_entities(entities)
 
-class DolbyCP750Mute(CoordinatorEntity, SwitchEntity):
+class DolbyCP750Mute(DolbyCP750Entity, SwitchEntity):
     """Mute switch for Dolby CP750."""
 
     _attr_has_entity_name = True
+    _data_keys = ("mute",)
 
     def __init__(
         self, 
@@ -82,20 +84,18 @@ class DolbyCP750Mute(CoordinatorEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on mute."""
         try:
-            await self.coordinator.protocol.send_command("cp750.sys.mute 1")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command("cp750.sys.mute 1")
         except Exception as err:
             _LOGGER.error("Failed to turn on mute: %s", err)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off mute."""
         try:
-            await self.coordinator.protocol.send_command("cp750.sys.mute 0")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_send_command("cp750.sys.mute 0")
         except Exception as err:
             _LOGGER.error("Failed to turn off mute: %s", err)
 
-class DolbyCP750Power(CoordinatorEntity, SwitchEntity):
+class DolbyCP750Power(DolbyCP750Entity, SwitchEntity):
     """Power switch for Dolby CP750."""
 
     _attr_has_entity_name = True
@@ -114,6 +114,7 @@ class DolbyCP750Power(CoordinatorEntity, SwitchEntity):
         self._attr_unique_id = f"{unique_id}_power"
         self._power_switch = power_switch
         self._hass = hass
+        self._power_state: State | None = None
         
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, unique_id)},
@@ -123,19 +124,33 @@ class DolbyCP750Power(CoordinatorEntity, SwitchEntity):
             configuration_url=f"http://{coordinator.protocol.host}",
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Follow the state of the underlying power switch."""
+        await super().async_added_to_hass()
+        self._power_state = self._hass.states.get(self._power_switch)
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._power_switch], self._async_power_switch_changed
+            )
+        )
+
+    @callback
+    def _async_power_switch_changed(self, event: Event) -> None:
+        """Render power switch changes, which don't go through the coordinator."""
+        self._power_state = event.data["new_state"]
+        self.async_write_ha_state()
+
     @property
     def available(self) -> bool:
         """Return if power switch is available."""
-        state = self._hass.states.get(self._power_switch)
-        return state is not None
+        return self._power_state is not None
 
     @property
     def is_on(self) -> bool | None:
         """Return True if device is on."""
-        if not self.available:
+        if self._power_state is None:
             return None
-        state = self._hass.states.get(self._power_switch)
-        return state.state == STATE_ON
+        return self._power_state.state == STATE_ON
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the device."""
@@ -145,7 +160,7 @@ class DolbyCP750Power(CoordinatorEntity, SwitchEntity):
             {"entity_id": self._power_switch},
             blocking=True
         )
-        await self.coordinator.async_request_refresh()
+        # The connection follows the power switch, see DolbyCP750Protocol.async_start
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the device."""
@@ -154,5 +169,4 @@ class DolbyCP750Power(CoordinatorEntity, SwitchEntity):
             "turn_off", 
             {"entity_id": self._power_switch},
             blocking=True
-        )
-        await self.coordinator.async_request_refresh()
\ No newline at end of file
+        )
\ No newline at end of file
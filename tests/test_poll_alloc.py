@@ -0,0 +1,30 @@
+"""Allocation bound of the coordinator poll, measured with tracemalloc."""
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "custom_components"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from bench_poll_alloc import (  # noqa: E402
+    MAX_ALLOCATION_RATIO,
+    measure_poll_allocations,
+)
+
+
+def test_poll_allocates_less_than_the_former_poll_path() -> None:
+    """A worst-case poll allocates well below the pre-user-014 baseline."""
+    current = asyncio.run(measure_poll_allocations(200, top=5))
+    legacy = asyncio.run(measure_poll_allocations(200, legacy=True))
+
+    bound = legacy.allocated_per_tick * MAX_ALLOCATION_RATIO
+    assert current.allocated_per_tick <= bound, "\n".join(
+        str(stat) for stat in current.top
+    )